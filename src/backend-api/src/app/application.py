@@ -106,6 +106,8 @@ class Application(Application_Base):
                     account_url=self.application_context.configuration.cosmos_db_account_url,
                     database_name=self.application_context.configuration.cosmos_db_database_name,
                     container_name=self.application_context.configuration.cosmos_db_process_log_container,
+                    cache_ttl_seconds=self.application_context.configuration.process_status_cache_ttl_seconds,
+                    cache_swr_seconds=self.application_context.configuration.process_status_cache_swr_seconds,
                 ),
             )
             # Repository is thread safe.
@@ -51,6 +51,15 @@ class Configuration(_configuration_base, KernelBaseSettings):
         default=None, env="COSMOS_DB_PROCESS_CONTAINER"
     )
 
+    # Process status snapshot cache: served fresh for the TTL, then served stale
+    # for up to the SWR window while it is refreshed in the background
+    process_status_cache_ttl_seconds: float = Field(
+        default=2.0, env="PROCESS_STATUS_CACHE_TTL_SECONDS"
+    )
+    process_status_cache_swr_seconds: float = Field(
+        default=10.0, env="PROCESS_STATUS_CACHE_SWR_SECONDS"
+    )
+
     storage_account_name: str | None = Field(default=None, env="STORAGE_ACCOUNT_NAME")
     storage_account_blob_url: str | None = Field(
         default=None, env="STORAGE_ACCOUNT_BLOB_URL"
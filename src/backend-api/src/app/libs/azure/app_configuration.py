@@ -48,8 +48,7 @@ class AppConfigurationHelper:
         Returns:
             dict: A dictionary of environment variables set from the configuration settings.
         """
-        # self.read_configuration()
-        for item in self.read_configuration():
-            os.environ[item.key] = item.value
+        # Stream settings straight into the environment without materializing a list
+        os.environ.update((item.key, item.value) for item in self.read_configuration())
 
         return os.environ
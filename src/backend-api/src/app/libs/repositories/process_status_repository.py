@@ -1,4 +1,8 @@
 import asyncio
+from collections import OrderedDict
+from functools import lru_cache
+import logging
+import time
 from typing import Any
 
 from sas.cosmosdb.sql.repository import RepositoryBase
@@ -11,6 +15,106 @@ from routers.models.process_agent_activities import (
 
 from datetime import datetime, UTC
 
+logger = logging.getLogger(__name__)
+
+# Process status documents are written by the processor and only polled here.
+# The repository is request-scoped, so the snapshot cache lives at module level
+# to be shared across requests: process_id -> (ProcessStatus, fetched_at).
+_SNAPSHOT_CACHE_SIZE = 256
+_MAX_STALE_ON_ERROR_SECONDS = 120.0
+_snapshot_cache: OrderedDict[str, tuple[ProcessStatus, float]] = OrderedDict()
+# One in-flight Cosmos DB read per process_id; concurrent misses and background
+# refreshes all await the same task instead of issuing duplicate reads.
+_inflight_reads: dict[str, asyncio.Task] = {}
+# Per-snapshot inputs to render_agent_status that don't depend on the clock: the
+# flattened agent data and each agent's relationships. Durations and velocity
+# are time-based, so they are recomputed on every render.
+_agent_views_cache: OrderedDict[str, tuple[ProcessStatus, dict, dict]] = OrderedDict()
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    """Done-callback for background refreshes, which nobody awaits."""
+    if not task.cancelled() and task.exception():
+        logger.warning(f"Failed to refresh process status: {task.exception()}")
+
+
+# Enhanced status icon mapping with more dynamic indicators
+_STATUS_ICONS = {
+    "speaking": "🗣️",
+    "thinking": "🤔",
+    "ready": "✅",
+    "standby": "⏸️",
+    "completed": "🏁",
+    "waiting": "⏳",
+    "failed": "❌",
+    "idle": "😴",
+}
+
+# Velocity indicators
+_VELOCITY_ICONS = {
+    "very_fast": "🔥",
+    "fast": "⚡",
+    "normal": "🔄",
+    "slow": "🐌",
+    "idle": "💤",
+}
+
+# Agent-specific ready messages based on role and process phase
+_AGENT_READY_MESSAGES = {
+    "Chief_Architect": {
+        "Analysis": "Ready to analyze architecture requirements",
+        "Design": "Ready to design migration architecture",
+        "YAML": "Ready to review YAML configurations",
+        "Documentation": "Ready to review final documentation",
+        "default": "Ready to provide architectural guidance",
+    },
+    "EKS_Expert": {
+        "Analysis": "Ready to analyze current EKS configuration",
+        "Design": "Ready to map EKS components to Azure",
+        "YAML": "Ready to validate EKS migration YAMLs",
+        "Documentation": "Ready to document EKS specifics",
+        "default": "Ready to provide EKS expertise",
+    },
+    "GKS_Expert": {
+        "Analysis": "Ready to analyze current AKS configuration",
+        "Design": "Ready to map AKS components to Azure",
+        "YAML": "Ready to validate AKS migration YAMLs",
+        "Documentation": "Ready to document AKS specifics",
+        "default": "Ready to provide AKS expertise",
+    },
+    "Azure_Expert": {
+        "Analysis": "Ready to identify Azure target services",
+        "Design": "Ready to design Azure architecture",
+        "YAML": "Ready to generate Azure YAML configurations",
+        "Documentation": "Ready to document Azure implementation",
+        "default": "Ready to provide Azure guidance",
+    },
+    "Technical_Writer": {
+        "Analysis": "Ready to document analysis findings",
+        "Design": "Ready to document architecture design",
+        "YAML": "Ready to document configuration details",
+        "Documentation": "Ready to finalize migration documentation",
+        "default": "Ready to document migration process",
+    },
+    "QA_Engineer": {
+        "Analysis": "Ready to validate analysis quality",
+        "Design": "Ready to validate design standards",
+        "YAML": "Ready to validate YAML configurations",
+        "Documentation": "Ready to perform final quality review",
+        "default": "Ready to ensure quality standards",
+    },
+}
+
+
+@lru_cache(maxsize=256)
+def _parse_utc_timestamp(value: str) -> datetime:
+    """Parse a "%Y-%m-%d %H:%M:%S UTC" telemetry timestamp.
+
+    The same started_at/last_update/history timestamps are re-parsed on every
+    status poll, so results are memoized. Raises ValueError on bad input.
+    """
+    return datetime.fromisoformat(value.replace(" UTC", "+00:00"))
+
 
 def calculate_activity_duration(activity_start: str) -> tuple[int, str]:
     """Calculate activity duration and return seconds and formatted string."""
@@ -18,7 +122,7 @@ def calculate_activity_duration(activity_start: str) -> tuple[int, str]:
         return 0, "0s"
 
     try:
-        start = datetime.fromisoformat(activity_start.replace(" UTC", "+00:00"))
+        start = _parse_utc_timestamp(activity_start)
         now = datetime.now(UTC)
         duration_seconds = int((now - start).total_seconds())
 
@@ -47,9 +151,7 @@ def analyze_agent_velocity(activity_history: list[dict[str, Any]]) -> str:
 
     for activity in activity_history[-10:]:  # Last 10 activities
         try:
-            timestamp = datetime.fromisoformat(
-                activity["timestamp"].replace(" UTC", "+00:00")
-            )
+            timestamp = _parse_utc_timestamp(activity["timestamp"])
             minutes_ago = (now - timestamp).total_seconds() / 60
             if minutes_ago <= 5:  # Last 5 minutes
                 recent_activities.append(activity)
@@ -104,79 +206,138 @@ def get_agent_relationship_status(
 
 
 class ProcessStatusRepository(RepositoryBase[ProcessStatus, str]):
-    def __init__(self, account_url: str, database_name: str, container_name: str):
+    def __init__(
+        self,
+        account_url: str,
+        database_name: str,
+        container_name: str,
+        cache_ttl_seconds: float = 2.0,
+        cache_swr_seconds: float = 10.0,
+    ):
         super().__init__(
             account_url=account_url,
             database_name=database_name,
             container_name=container_name,
         )
-        # Add semaphore for controlling concurrent operations
-        self._read_semaphore = asyncio.Semaphore(50)  # Allow up to 50 concurrent reads
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._cache_swr_seconds = cache_swr_seconds
         self._write_semaphore = asyncio.Semaphore(
             10
         )  # Limit writes for data consistency
 
+    async def _get_cached_async(self, process_id: str) -> ProcessStatus | None:
+        """
+        Get a process status with stale-while-revalidate caching.
+
+        Fresh entries are returned directly. Entries past the TTL but within the
+        SWR window are returned as-is while a background refresh is scheduled.
+        Anything older, or missing, is read from Cosmos DB; if that read fails,
+        a snapshot up to _MAX_STALE_ON_ERROR_SECONDS old is served instead.
+        """
+        cached = _snapshot_cache.get(process_id)
+        if cached:
+            status, fetched_at = cached
+            age = time.monotonic() - fetched_at
+            if age <= self._cache_ttl_seconds:
+                return status
+            if age <= self._cache_ttl_seconds + self._cache_swr_seconds:
+                if process_id not in _inflight_reads:
+                    self._fetch_shared(process_id).add_done_callback(
+                        _log_refresh_failure
+                    )
+                return status
+
+        try:
+            # Shield so a cancelled poll doesn't cancel the read other callers await
+            return await asyncio.shield(self._fetch_shared(process_id))
+        except Exception as e:
+            # Transient Cosmos DB failure (e.g. throttling): a recent snapshot is
+            # better for a polling UI than an error
+            if cached and time.monotonic() - cached[1] <= _MAX_STALE_ON_ERROR_SECONDS:
+                logger.warning(
+                    f"Serving stale process status {process_id} after read failure: {e}"
+                )
+                return cached[0]
+            raise
+
+    def _fetch_shared(self, process_id: str) -> asyncio.Task:
+        task = _inflight_reads.get(process_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(process_id))
+            _inflight_reads[process_id] = task
+            task.add_done_callback(lambda _: _inflight_reads.pop(process_id, None))
+        return task
+
+    async def _fetch_and_cache(self, process_id: str) -> ProcessStatus | None:
+        status = await self.get_async(process_id)
+        if status:
+            _snapshot_cache[process_id] = (status, time.monotonic())
+            _snapshot_cache.move_to_end(process_id)
+            while len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+                _snapshot_cache.popitem(last=False)
+        else:
+            _snapshot_cache.pop(process_id, None)
+        return status
+
     async def get_process_agent_activities_by_process_id(
         self, process_id: str
     ) -> ProcessStatus:
         """
         Get the agent activities for a specific process ID.
         """
-        async with self._read_semaphore:  # Control concurrent reads
-            process_status = await self.get_async(process_id)
-            if not process_status:
-                return None
-            return process_status
+        process_status = await self._get_cached_async(process_id)
+        if not process_status:
+            return None
+        return process_status
 
     async def get_process_status_by_process_id(
         self, process_id: str
     ) -> ProcessStatusSnapshot | None:
         """
-        Get the process status by process ID with concurrency control.
+        Get the process status by process ID.
         """
 
-        async with self._read_semaphore:  # Control concurrent reads
-            # Get Status by Phase
-            print(
-                f"🔍 DEBUG: Searching for process_id: '{process_id}' (type: {type(process_id)})"
-            )
+        # Get Status by Phase
+        print(
+            f"🔍 DEBUG: Searching for process_id: '{process_id}' (type: {type(process_id)})"
+        )
 
-            status = await self.get_async(process_id)
-            if status != None:
-                return ProcessStatusSnapshot(
-                    process_id=status.id,  # Fix: use process_id instead of id
-                    step=status.step,
-                    phase=status.phase,
-                    status=status.status,
-                    last_update_time=status.last_update_time,  # Add missing field
-                    started_at_time=status.started_at_time,
-                    failure_agent=status.failure_agent,
-                    failure_reason=status.failure_reason,
-                    failure_details=status.failure_details,
-                    failure_step=status.failure_step,
-                    failure_timestamp=status.failure_timestamp,
-                    stack_trace=status.stack_trace,
-                    agents=[
-                        AgentStatus(
-                            name=agent.name,
-                            is_currently_speaking=agent.is_currently_speaking,
-                            is_active=agent.is_active,
-                            current_action=agent.current_action,
-                            current_speaking_content=agent.current_speaking_content,
-                            last_message=agent.last_message_preview,
-                            participating_status=agent.participation_status,
-                            current_reasoning=agent.current_reasoning,
-                            last_reasoning=agent.last_reasoning,
-                            thinking_about=agent.thinking_about,
-                            reasoning_steps=agent.reasoning_steps,
-                            last_activity_summary=agent.last_activity_summary,
-                        )
-                        for agent in status.agents.values()
-                        if agent.is_active
-                    ],
-                )
-            else:
-                return None
+        status = await self._get_cached_async(process_id)
+        if status != None:
+            return ProcessStatusSnapshot(
+                process_id=status.id,  # Fix: use process_id instead of id
+                step=status.step,
+                phase=status.phase,
+                status=status.status,
+                last_update_time=status.last_update_time,  # Add missing field
+                started_at_time=status.started_at_time,
+                failure_agent=status.failure_agent,
+                failure_reason=status.failure_reason,
+                failure_details=status.failure_details,
+                failure_step=status.failure_step,
+                failure_timestamp=status.failure_timestamp,
+                stack_trace=status.stack_trace,
+                agents=[
+                    AgentStatus(
+                        name=agent.name,
+                        is_currently_speaking=agent.is_currently_speaking,
+                        is_active=agent.is_active,
+                        current_action=agent.current_action,
+                        current_speaking_content=agent.current_speaking_content,
+                        last_message=agent.last_message_preview,
+                        participating_status=agent.participation_status,
+                        current_reasoning=agent.current_reasoning,
+                        last_reasoning=agent.last_reasoning,
+                        thinking_about=agent.thinking_about,
+                        reasoning_steps=agent.reasoning_steps,
+                        last_activity_summary=agent.last_activity_summary,
+                    )
+                    for agent in status.agents.values()
+                    if agent.is_active
+                ],
+            )
+        else:
+            return None
 
     # async def update_process_status(self, status: ProcessStatus) -> ProcessStatus:
     #     """
@@ -199,420 +360,376 @@ class ProcessStatusRepository(RepositoryBase[ProcessStatus, str]):
         Provides 300% more insights while maintaining 100% compatibility
         """
 
-        async with self._read_semaphore:
-            # Get both snapshot and full data for enhanced analysis
-            process_snapshot = await self.get_process_status_by_process_id(process_id)
-            full_process_data = await self.get_async(process_id)
-
-            if not process_snapshot and not full_process_data:
-                return {
-                    "process_id": process_id,
-                    "phase": "unknown",
-                    "status": "not_found",
-                    "agents": [],
-                }
+        process_data = await self._get_cached_async(process_id)
 
-            # Use full data if available, fallback to snapshot
-            process_data = full_process_data or process_snapshot
-            agents_data = {}
-
-            if full_process_data and hasattr(full_process_data, "agents"):
-                # Convert full agent data for enhanced analysis
-                agents_data = {
-                    name: {
-                        "name": agent.name,
-                        "current_action": agent.current_action,
-                        "last_message_preview": agent.last_message_preview,
-                        "last_update_time": agent.last_update_time,
-                        "is_active": agent.is_active,
-                        "is_currently_speaking": agent.is_currently_speaking,
-                        "is_currently_thinking": agent.is_currently_thinking,
-                        "participation_status": agent.participation_status,
-                        "activity_history": [
-                            {
-                                "timestamp": h.timestamp,
-                                "action": h.action,
-                                "message_preview": h.message_preview,
-                                "step": h.step,
-                                "tool_used": h.tool_used,
-                            }
-                            for h in getattr(agent, "activity_history", [])
-                        ],
-                        "thinking_about": getattr(agent, "thinking_about", ""),
-                        "current_speaking_content": getattr(
-                            agent, "current_speaking_content", ""
-                        ),
-                        "last_activity_summary": getattr(
-                            agent, "last_activity_summary", ""
-                        ),
-                        "message_word_count": getattr(agent, "message_word_count", 0),
-                    }
-                    for name, agent in full_process_data.agents.items()
-                }
-            elif process_snapshot and hasattr(process_snapshot, "agents"):
-                # Convert snapshot agent data
-                agents_data = {
-                    agent.name: {
-                        "name": agent.name,
-                        "current_action": agent.current_action,
-                        "last_message_preview": agent.last_message,  # Note: different field name
-                        "last_update_time": "",
-                        "is_active": agent.is_active,
-                        "is_currently_speaking": agent.is_currently_speaking,
-                        "is_currently_thinking": False,
-                        "participation_status": agent.participating_status,  # Note: different field name
-                        "activity_history": [],
-                        "thinking_about": getattr(agent, "thinking_about", ""),
-                        "current_speaking_content": getattr(
-                            agent, "current_speaking_content", ""
-                        ),
-                        "last_activity_summary": getattr(
-                            agent, "last_activity_summary", ""
-                        ),
-                    }
-                    for agent in process_snapshot.agents
-                }
+        if not process_data:
+            return {
+                "process_id": process_id,
+                "phase": "unknown",
+                "status": "not_found",
+                "agents": [],
+            }
 
-            if not agents_data:
-                return {
-                    "process_id": process_id,
-                    "phase": getattr(process_data, "phase", "unknown"),
-                    "status": getattr(process_data, "status", "unknown"),
-                    "agents": [],
+        # Same cached snapshot as the last render: reuse its agent views
+        cached_views = _agent_views_cache.get(process_id)
+        if cached_views and cached_views[0] is process_data:
+            agents_data, agent_relationships = cached_views[1], cached_views[2]
+        else:
+            # Copy only what the analysis below reads. Velocity looks at the
+            # last 10 history entries, so older history is not converted.
+            agents_data = {
+                name: {
+                    "name": agent.name,
+                    "current_action": agent.current_action,
+                    "last_message_preview": agent.last_message_preview,
+                    "last_update_time": agent.last_update_time,
+                    "is_active": agent.is_active,
+                    "is_currently_speaking": agent.is_currently_speaking,
+                    "is_currently_thinking": agent.is_currently_thinking,
+                    "participation_status": agent.participation_status,
+                    "activity_history": [
+                        {
+                            "timestamp": h.timestamp,
+                            "action": h.action,
+                            "message_preview": h.message_preview,
+                            "step": h.step,
+                            "tool_used": h.tool_used,
+                        }
+                        for h in getattr(agent, "activity_history", [])[-10:]
+                    ],
+                    "thinking_about": getattr(agent, "thinking_about", ""),
+                    "current_speaking_content": getattr(
+                        agent, "current_speaking_content", ""
+                    ),
+                    "last_activity_summary": getattr(
+                        agent, "last_activity_summary", ""
+                    ),
+                    "message_word_count": getattr(agent, "message_word_count", 0),
                 }
-
-            # Enhanced status icon mapping with more dynamic indicators
-            status_icons = {
-                "speaking": "🗣️",
-                "thinking": "🤔",
-                "ready": "✅",
-                "standby": "⏸️",
-                "completed": "🏁",
-                "waiting": "⏳",
-                "failed": "❌",
-                "idle": "😴",
+                for name, agent in process_data.agents.items()
             }
-
-            # Velocity indicators
-            velocity_icons = {
-                "very_fast": "🔥",
-                "fast": "⚡",
-                "normal": "🔄",
-                "slow": "🐌",
-                "idle": "💤",
+            agent_relationships = {
+                name: get_agent_relationship_status(agent_data, agents_data)
+                for name, agent_data in agents_data.items()
             }
+            _agent_views_cache[process_id] = (
+                process_data,
+                agents_data,
+                agent_relationships,
+            )
+            _agent_views_cache.move_to_end(process_id)
+            while len(_agent_views_cache) > _SNAPSHOT_CACHE_SIZE:
+                _agent_views_cache.popitem(last=False)
 
-            formatted_lines = []
-            agent_metrics = {}
-
-            # Check if process failed early (before agents really started working)
-            process_failed = getattr(process_data, "status", "") == "failed"
-            process_duration_seconds = 0
-            if hasattr(process_data, "started_at_time") and hasattr(
-                process_data, "last_update_time"
-            ):
-                try:
-                    start = datetime.fromisoformat(
-                        process_data.started_at_time.replace(" UTC", "+00:00")
-                    )
-                    end = datetime.fromisoformat(
-                        process_data.last_update_time.replace(" UTC", "+00:00")
-                    )
-                    process_duration_seconds = int((end - start).total_seconds())
-                except Exception:
-                    pass
-
-            early_failure = (
-                process_failed and process_duration_seconds < 30
-            )  # Failed in less than 30 seconds
-
-            # Analyze each agent with enhanced insights
-            for agent_name, agent_data in agents_data.items():
-                # Calculate dynamic metrics
-                activity_history = agent_data.get("activity_history", [])
-                velocity = analyze_agent_velocity(activity_history)
-
-                # Get timing information
-                last_update = agent_data.get("last_update_time", "")
-                duration_seconds, duration_str = calculate_activity_duration(
-                    last_update
-                )
-
-                # Analyze relationships
-                relationships = get_agent_relationship_status(agent_data, agents_data)
-
-                # Get status and action
-                status = agent_data.get("participation_status", "unknown").lower()
-                current_action = agent_data.get("current_action", "idle")
-                is_active = agent_data.get("is_active", False)
-                is_thinking = agent_data.get("is_currently_thinking", False)
-                is_speaking = agent_data.get("is_currently_speaking", False)
-
-                # Override status for failed processes or system errors
-                if process_failed and agent_name.lower() in [
-                    "system",
-                    "error_handler",
-                    "errorhandler",
-                ]:
-                    status = "failed"
-                    is_active = False
-
-                # Choose primary icon
-                primary_icon = status_icons.get(status, "❓")
-                if is_speaking:
-                    primary_icon = "🗣️"
-                elif is_thinking:
-                    primary_icon = "🤔"
-                elif agent_data.get("current_action") == "process_failed":
-                    primary_icon = "❌"
-
-                # Add velocity indicator
-                velocity_icon = velocity_icons.get(velocity, "🔄")
-
-                # Build enhanced message using your existing logic + enhancements
-                message_parts = []
-
-                # Use your existing message logic
-                if agent_name.lower() == "system":
-                    message_parts.append(
-                        f'"{agent_data.get("current_speaking_content") or agent_data.get("last_activity_summary") or agent_data.get("last_message_preview") or "System status..."}"'
-                    )
-                elif is_speaking and agent_data.get("current_speaking_content"):
-                    content = agent_data["current_speaking_content"]
-                    message_parts.append(f'"{content}"')
-                    if agent_data.get("message_word_count", 0) > 0:
-                        message_parts.append(
-                            f"({agent_data['message_word_count']} words)"
-                        )
-                elif status == "thinking" and agent_data.get("thinking_about"):
-                    message_parts.append(f'"{agent_data["thinking_about"]}"')
-                elif status == "ready":
-                    # Use your existing context-aware ready message
-                    ready_message = self._get_ready_status_message(
-                        agent_name,
-                        getattr(process_data, "step", "")
-                        or getattr(process_data, "phase", ""),
-                        getattr(process_data, "phase", ""),
-                        status,
-                    )
-                    message_parts.append(f'"{ready_message}"')
-                elif agent_data.get("last_message_preview"):
-                    message_parts.append(f'"{agent_data["last_message_preview"]}"')
-                elif agent_data.get("last_activity_summary"):
-                    message_parts.append(f'"{agent_data["last_activity_summary"]}"')
-                elif status == "completed":
-                    message_parts.append('"Task completed successfully"')
-                elif status == "standby":
-                    phase = getattr(process_data, "phase", "current").lower()
-                    message_parts.append(f'"Standing by for {phase} tasks"')
-                else:
-                    action_display = current_action.replace("_", " ").title()
-                    message_parts.append(f'"{action_display}"')
-
-                # Add enhanced timing if active
-                if is_active and duration_seconds > 30:
-                    message_parts.append(f"({duration_str})")
-
-                # Add relationship indicators
-                if relationships["waiting_for"]:
-                    waiting_names = [
-                        name.replace("_", " ")
-                        for name in relationships["waiting_for"][:2]
-                    ]
-                    message_parts.append(f"⏳ Waiting for: {', '.join(waiting_names)}")
-
-                if relationships["blocking"] and is_active:
-                    blocking_count = len(relationships["blocking"])
-                    message_parts.append(f"🚧 Blocking {blocking_count} agents")
-
-                # Format the display line with enhanced indicators
-                agent_display_name = agent_name.replace("_", " ")
-                activity_indicator = "✓" if is_active else "✗"
-
-                # Special formatting for critical situations
-                if agent_data.get("current_action") == "process_failed":
-                    line = f"{activity_indicator}[❌🔥] {agent_display_name}: FAILED - {' | '.join(message_parts)}"
-                elif relationships["blocking"] and len(relationships["blocking"]) > 3:
-                    line = f"{activity_indicator}[{primary_icon}🚧] {agent_display_name}: {status} - {' | '.join(message_parts)}"
-                elif velocity == "very_fast":
-                    line = f"{activity_indicator}[{primary_icon}{velocity_icon}] {agent_display_name}: {status} - {' | '.join(message_parts)}"
-                else:
-                    line = f"{activity_indicator}[{primary_icon}] {agent_display_name}: {status} - {' | '.join(message_parts)}"
-
-                formatted_lines.append(line)
-
-                # Store metrics for summary
-                agent_metrics[agent_name] = {
-                    "velocity": velocity,
-                    "is_active": is_active,
-                    "duration_seconds": duration_seconds,
-                    "blocking_count": len(relationships["blocking"]),
-                    "status": status,
-                }
-
-            # Generate enhanced process summary
-            active_count = sum(1 for m in agent_metrics.values() if m["is_active"])
-            total_blocking = sum(m["blocking_count"] for m in agent_metrics.values())
-            failed_agents = [
-                name for name, m in agent_metrics.items() if m["status"] == "failed"
-            ]
-            fast_agents = [
-                name
-                for name, m in agent_metrics.items()
-                if m["velocity"] in ["fast", "very_fast"]
-            ]
-
-            # Process health assessment
-            if failed_agents:
-                health_status = "🔴 CRITICAL"
-            elif total_blocking > 5:
-                health_status = "🟡 BOTTLENECKED"
-            elif active_count > 5:
-                health_status = "🟢 VERY_ACTIVE"
-            elif active_count > 2:
-                health_status = "🟢 ACTIVE"
-            else:
-                health_status = "🟢 STABLE"
-
+        if not agents_data:
             return {
-                # Your existing fields (100% compatible)
                 "process_id": process_id,
                 "phase": getattr(process_data, "phase", "unknown"),
                 "status": getattr(process_data, "status", "unknown"),
-                "step": getattr(process_data, "step", ""),
-                "last_update_time": getattr(process_data, "last_update_time", ""),
-                "started_at_time": getattr(process_data, "started_at_time", ""),
-                "agents": formatted_lines,
-                "failure_reason": getattr(process_data, "failure_reason", ""),
-                "failure_details": getattr(process_data, "failure_details", ""),
-                "failure_step": getattr(process_data, "failure_step", ""),
-                "failure_agent": getattr(process_data, "failure_agent", ""),
-                "failure_timestamp": getattr(process_data, "failure_timestamp", ""),
-                "stack_trace": getattr(process_data, "stack_trace", ""),
-                # NEW: Enhanced analytics (additive, doesn't break existing code)
-                "health_status": health_status,
-                "active_agent_count": active_count,
-                "total_agents": len(agents_data),
-                "bottleneck_score": total_blocking,
-                "fast_agents": fast_agents,
-                "failed_agents": failed_agents,
+                "agents": [],
             }
 
-    async def render_agent_status_old(self, process_id: str) -> dict:
-        """Enhanced agent status rendering with context-aware messages"""
-
-        async with self._read_semaphore:
-            process_snapshot = await self.get_process_status_by_process_id(process_id)
+        formatted_lines = []
+        agent_metrics = {}
+
+        # Check if process failed early (before agents really started working)
+        process_failed = getattr(process_data, "status", "") == "failed"
+        process_duration_seconds = 0
+        if hasattr(process_data, "started_at_time") and hasattr(
+            process_data, "last_update_time"
+        ):
+            try:
+                start = _parse_utc_timestamp(process_data.started_at_time)
+                end = _parse_utc_timestamp(process_data.last_update_time)
+                process_duration_seconds = int((end - start).total_seconds())
+            except Exception:
+                pass
+
+        early_failure = (
+            process_failed and process_duration_seconds < 30
+        )  # Failed in less than 30 seconds
+
+        # Analyze each agent with enhanced insights
+        for agent_name, agent_data in agents_data.items():
+            # Calculate dynamic metrics
+            activity_history = agent_data.get("activity_history", [])
+            velocity = analyze_agent_velocity(activity_history)
+
+            # Get timing information
+            last_update = agent_data.get("last_update_time", "")
+            duration_seconds, duration_str = calculate_activity_duration(last_update)
+
+            # Analyze relationships
+            relationships = agent_relationships[agent_name]
+
+            # Get status and action
+            status = agent_data.get("participation_status", "unknown").lower()
+            current_action = agent_data.get("current_action", "idle")
+            is_active = agent_data.get("is_active", False)
+            is_thinking = agent_data.get("is_currently_thinking", False)
+            is_speaking = agent_data.get("is_currently_speaking", False)
+
+            # Override status for failed processes or system errors
+            if process_failed and agent_name.lower() in [
+                "system",
+                "error_handler",
+                "errorhandler",
+            ]:
+                status = "failed"
+                is_active = False
+
+            # Choose primary icon
+            primary_icon = _STATUS_ICONS.get(status, "❓")
+            if is_speaking:
+                primary_icon = "🗣️"
+            elif is_thinking:
+                primary_icon = "🤔"
+            elif agent_data.get("current_action") == "process_failed":
+                primary_icon = "❌"
+
+            # Add velocity indicator
+            velocity_icon = _VELOCITY_ICONS.get(velocity, "🔄")
+
+            # Build enhanced message using your existing logic + enhancements
+            message_parts = []
+
+            # Use your existing message logic
+            if agent_name.lower() == "system":
+                message_parts.append(
+                    f'"{agent_data.get("current_speaking_content") or agent_data.get("last_activity_summary") or agent_data.get("last_message_preview") or "System status..."}"'
+                )
+            elif is_speaking and agent_data.get("current_speaking_content"):
+                content = agent_data["current_speaking_content"]
+                message_parts.append(f'"{content}"')
+                if agent_data.get("message_word_count", 0) > 0:
+                    message_parts.append(f"({agent_data['message_word_count']} words)")
+            elif status == "thinking" and agent_data.get("thinking_about"):
+                message_parts.append(f'"{agent_data["thinking_about"]}"')
+            elif status == "ready":
+                # Use your existing context-aware ready message
+                ready_message = self._get_ready_status_message(
+                    agent_name,
+                    getattr(process_data, "step", "")
+                    or getattr(process_data, "phase", ""),
+                    getattr(process_data, "phase", ""),
+                    status,
+                )
+                message_parts.append(f'"{ready_message}"')
+            elif agent_data.get("last_message_preview"):
+                message_parts.append(f'"{agent_data["last_message_preview"]}"')
+            elif agent_data.get("last_activity_summary"):
+                message_parts.append(f'"{agent_data["last_activity_summary"]}"')
+            elif status == "completed":
+                message_parts.append('"Task completed successfully"')
+            elif status == "standby":
+                phase = getattr(process_data, "phase", "current").lower()
+                message_parts.append(f'"Standing by for {phase} tasks"')
+            else:
+                action_display = current_action.replace("_", " ").title()
+                message_parts.append(f'"{action_display}"')
+
+            # Add enhanced timing if active
+            if is_active and duration_seconds > 30:
+                message_parts.append(f"({duration_str})")
+
+            # Add relationship indicators
+            if relationships["waiting_for"]:
+                waiting_names = [
+                    name.replace("_", " ") for name in relationships["waiting_for"][:2]
+                ]
+                message_parts.append(f"⏳ Waiting for: {', '.join(waiting_names)}")
+
+            if relationships["blocking"] and is_active:
+                blocking_count = len(relationships["blocking"])
+                message_parts.append(f"🚧 Blocking {blocking_count} agents")
+
+            # Format the display line with enhanced indicators
+            agent_display_name = agent_name.replace("_", " ")
+            activity_indicator = "✓" if is_active else "✗"
+
+            # Special formatting for critical situations
+            if agent_data.get("current_action") == "process_failed":
+                line = f"{activity_indicator}[❌🔥] {agent_display_name}: FAILED - {' | '.join(message_parts)}"
+            elif relationships["blocking"] and len(relationships["blocking"]) > 3:
+                line = f"{activity_indicator}[{primary_icon}🚧] {agent_display_name}: {status} - {' | '.join(message_parts)}"
+            elif velocity == "very_fast":
+                line = f"{activity_indicator}[{primary_icon}{velocity_icon}] {agent_display_name}: {status} - {' | '.join(message_parts)}"
+            else:
+                line = f"{activity_indicator}[{primary_icon}] {agent_display_name}: {status} - {' | '.join(message_parts)}"
 
-            if not process_snapshot:
-                return {
-                    "process_id": process_id,
-                    "phase": "unknown",
-                    "status": "not_found",
-                    "agents": [],
-                }
+            formatted_lines.append(line)
 
-            # Status icon mapping
-            status_icons = {
-                "speaking": "🗣️",
-                "thinking": "🤔",
-                "ready": "✅",
-                "standby": "⏸️",
-                "completed": "🏁",
-                "waiting": "⏳",
+            # Store metrics for summary
+            agent_metrics[agent_name] = {
+                "velocity": velocity,
+                "is_active": is_active,
+                "duration_seconds": duration_seconds,
+                "blocking_count": len(relationships["blocking"]),
+                "status": status,
             }
 
-            formatted_lines = []
-
-            for agent in process_snapshot.agents:
-                status = agent.participating_status.lower()
-                icon = status_icons.get(status, "❓")
-
-                # ENHANCED MESSAGE DISPLAY LOGIC
-                if agent.name == "system":
-                    # System agent gets special treatment
-                    message = f'"{agent.current_speaking_content or agent.last_activity_summary or agent.last_message or "System status..."}"'
-
-                elif agent.is_currently_speaking and agent.current_speaking_content:
-                    # Speaking agent - show actual content
-                    content = agent.current_speaking_content
-                    # if len(content) > 85:
-                    #     content = f"{content[:80]}..."
-                    message = f'"{content}"'
-
-                    # Add word count if available
-                    if (
-                        hasattr(agent, "message_word_count")
-                        and agent.message_word_count > 0
-                    ):
-                        message += f" ({agent.message_word_count} words)"
-
-                elif (
-                    status == "thinking"
-                    and hasattr(agent, "thinking_about")
-                    and agent.thinking_about
-                ):
-                    # Thinking agent - show specific thoughts
-                    message = f'"{agent.thinking_about}"'
-
-                elif status == "ready":
-                    # CONTEXT-AWARE READY MESSAGE
-                    ready_message = self._get_ready_status_message(
-                        agent.name,
-                        process_snapshot.step or process_snapshot.phase,
-                        process_snapshot.phase,
-                        status,
-                    )
-                    message = f'"{ready_message}"'
-
-                elif agent.last_message:
-                    # Show last message if available
-                    content = agent.last_message
-                    # if len(content) > 60:
-                    #     content = f"{content[:55]}..."
-                    message = f'"{content}"'
-
-                elif agent.last_activity_summary:
-                    # Show last activity summary
-                    message = f'"{agent.last_activity_summary}"'
-
-                elif status == "completed":
-                    message = '"Task completed successfully"'
-
-                elif status == "standby":
-                    phase = (
-                        process_snapshot.phase.lower()
-                        if process_snapshot.phase
-                        else "current"
-                    )
-                    message = f'"Standing by for {phase} tasks"'
+        # Generate enhanced process summary
+        active_count = sum(1 for m in agent_metrics.values() if m["is_active"])
+        total_blocking = sum(m["blocking_count"] for m in agent_metrics.values())
+        failed_agents = [
+            name for name, m in agent_metrics.items() if m["status"] == "failed"
+        ]
+        fast_agents = [
+            name
+            for name, m in agent_metrics.items()
+            if m["velocity"] in ["fast", "very_fast"]
+        ]
+
+        # Process health assessment
+        if failed_agents:
+            health_status = "🔴 CRITICAL"
+        elif total_blocking > 5:
+            health_status = "🟡 BOTTLENECKED"
+        elif active_count > 5:
+            health_status = "🟢 VERY_ACTIVE"
+        elif active_count > 2:
+            health_status = "🟢 ACTIVE"
+        else:
+            health_status = "🟢 STABLE"
+
+        return {
+            # Your existing fields (100% compatible)
+            "process_id": process_id,
+            "phase": getattr(process_data, "phase", "unknown"),
+            "status": getattr(process_data, "status", "unknown"),
+            "step": getattr(process_data, "step", ""),
+            "last_update_time": getattr(process_data, "last_update_time", ""),
+            "started_at_time": getattr(process_data, "started_at_time", ""),
+            "agents": formatted_lines,
+            "failure_reason": getattr(process_data, "failure_reason", ""),
+            "failure_details": getattr(process_data, "failure_details", ""),
+            "failure_step": getattr(process_data, "failure_step", ""),
+            "failure_agent": getattr(process_data, "failure_agent", ""),
+            "failure_timestamp": getattr(process_data, "failure_timestamp", ""),
+            "stack_trace": getattr(process_data, "stack_trace", ""),
+            # NEW: Enhanced analytics (additive, doesn't break existing code)
+            "health_status": health_status,
+            "active_agent_count": active_count,
+            "total_agents": len(agents_data),
+            "bottleneck_score": total_blocking,
+            "fast_agents": fast_agents,
+            "failed_agents": failed_agents,
+        }
 
-                else:
-                    # Enhanced fallback
-                    action = agent.current_action or "waiting"
-                    message = f'"{action.replace("_", " ").title()}"'
+    async def render_agent_status_old(self, process_id: str) -> dict:
+        """Enhanced agent status rendering with context-aware messages"""
 
-                # Format the display line
-                agent_display_name = agent.name.replace("_", " ")
-                line = f"{'✓' if agent.is_active else '✗'}[{icon}] {agent_display_name}: {status} - {message}"
-                formatted_lines.append(line)
+        process_snapshot = await self.get_process_status_by_process_id(process_id)
 
+        if not process_snapshot:
             return {
                 "process_id": process_id,
-                "phase": process_snapshot.phase,
-                "status": process_snapshot.status,
-                "step": getattr(process_snapshot, "step", ""),
-                "last_update_time": process_snapshot.last_update_time,
-                "started_at_time": process_snapshot.started_at_time,
-                "agents": formatted_lines,
-                "failure_reason": process_snapshot.failure_reason,
-                "failure_details": process_snapshot.failure_details,
-                "failure_step": process_snapshot.failure_step,
-                "failure_agent": process_snapshot.failure_agent,
-                "failure_timestamp": process_snapshot.failure_timestamp,
-                "stack_trace": process_snapshot.stack_trace,
+                "phase": "unknown",
+                "status": "not_found",
+                "agents": [],
             }
 
+        # Status icon mapping
+        status_icons = {
+            "speaking": "🗣️",
+            "thinking": "🤔",
+            "ready": "✅",
+            "standby": "⏸️",
+            "completed": "🏁",
+            "waiting": "⏳",
+        }
+
+        formatted_lines = []
+
+        for agent in process_snapshot.agents:
+            status = agent.participating_status.lower()
+            icon = status_icons.get(status, "❓")
+
+            # ENHANCED MESSAGE DISPLAY LOGIC
+            if agent.name == "system":
+                # System agent gets special treatment
+                message = f'"{agent.current_speaking_content or agent.last_activity_summary or agent.last_message or "System status..."}"'
+
+            elif agent.is_currently_speaking and agent.current_speaking_content:
+                # Speaking agent - show actual content
+                content = agent.current_speaking_content
+                # if len(content) > 85:
+                #     content = f"{content[:80]}..."
+                message = f'"{content}"'
+
+                # Add word count if available
+                if (
+                    hasattr(agent, "message_word_count")
+                    and agent.message_word_count > 0
+                ):
+                    message += f" ({agent.message_word_count} words)"
+
+            elif (
+                status == "thinking"
+                and hasattr(agent, "thinking_about")
+                and agent.thinking_about
+            ):
+                # Thinking agent - show specific thoughts
+                message = f'"{agent.thinking_about}"'
+
+            elif status == "ready":
+                # CONTEXT-AWARE READY MESSAGE
+                ready_message = self._get_ready_status_message(
+                    agent.name,
+                    process_snapshot.step or process_snapshot.phase,
+                    process_snapshot.phase,
+                    status,
+                )
+                message = f'"{ready_message}"'
+
+            elif agent.last_message:
+                # Show last message if available
+                content = agent.last_message
+                # if len(content) > 60:
+                #     content = f"{content[:55]}..."
+                message = f'"{content}"'
+
+            elif agent.last_activity_summary:
+                # Show last activity summary
+                message = f'"{agent.last_activity_summary}"'
+
+            elif status == "completed":
+                message = '"Task completed successfully"'
+
+            elif status == "standby":
+                phase = (
+                    process_snapshot.phase.lower()
+                    if process_snapshot.phase
+                    else "current"
+                )
+                message = f'"Standing by for {phase} tasks"'
+
+            else:
+                # Enhanced fallback
+                action = agent.current_action or "waiting"
+                message = f'"{action.replace("_", " ").title()}"'
+
+            # Format the display line
+            agent_display_name = agent.name.replace("_", " ")
+            line = f"{'✓' if agent.is_active else '✗'}[{icon}] {agent_display_name}: {status} - {message}"
+            formatted_lines.append(line)
+
+        return {
+            "process_id": process_id,
+            "phase": process_snapshot.phase,
+            "status": process_snapshot.status,
+            "step": getattr(process_snapshot, "step", ""),
+            "last_update_time": process_snapshot.last_update_time,
+            "started_at_time": process_snapshot.started_at_time,
+            "agents": formatted_lines,
+            "failure_reason": process_snapshot.failure_reason,
+            "failure_details": process_snapshot.failure_details,
+            "failure_step": process_snapshot.failure_step,
+            "failure_agent": process_snapshot.failure_agent,
+            "failure_timestamp": process_snapshot.failure_timestamp,
+            "stack_trace": process_snapshot.stack_trace,
+        }
+
     def _get_ready_status_message(
         self,
         agent_name: str,
@@ -622,55 +739,9 @@ class ProcessStatusRepository(RepositoryBase[ProcessStatus, str]):
     ) -> str:
         """Generate context-aware ready status messages"""
 
-        # Agent-specific ready messages based on role and process phase
-        agent_ready_messages = {
-            "Chief_Architect": {
-                "Analysis": "Ready to analyze architecture requirements",
-                "Design": "Ready to design migration architecture",
-                "YAML": "Ready to review YAML configurations",
-                "Documentation": "Ready to review final documentation",
-                "default": "Ready to provide architectural guidance",
-            },
-            "EKS_Expert": {
-                "Analysis": "Ready to analyze current EKS configuration",
-                "Design": "Ready to map EKS components to Azure",
-                "YAML": "Ready to validate EKS migration YAMLs",
-                "Documentation": "Ready to document EKS specifics",
-                "default": "Ready to provide EKS expertise",
-            },
-            "GKS_Expert": {
-                "Analysis": "Ready to analyze current AKS configuration",
-                "Design": "Ready to map AKS components to Azure",
-                "YAML": "Ready to validate AKS migration YAMLs",
-                "Documentation": "Ready to document AKS specifics",
-                "default": "Ready to provide AKS expertise",
-            },
-            "Azure_Expert": {
-                "Analysis": "Ready to identify Azure target services",
-                "Design": "Ready to design Azure architecture",
-                "YAML": "Ready to generate Azure YAML configurations",
-                "Documentation": "Ready to document Azure implementation",
-                "default": "Ready to provide Azure guidance",
-            },
-            "Technical_Writer": {
-                "Analysis": "Ready to document analysis findings",
-                "Design": "Ready to document architecture design",
-                "YAML": "Ready to document configuration details",
-                "Documentation": "Ready to finalize migration documentation",
-                "default": "Ready to document migration process",
-            },
-            "QA_Engineer": {
-                "Analysis": "Ready to validate analysis quality",
-                "Design": "Ready to validate design standards",
-                "YAML": "Ready to validate YAML configurations",
-                "Documentation": "Ready to perform final quality review",
-                "default": "Ready to ensure quality standards",
-            },
-        }
-
         # Get agent-specific messages
-        if agent_name in agent_ready_messages:
-            agent_messages = agent_ready_messages[agent_name]
+        if agent_name in _AGENT_READY_MESSAGES:
+            agent_messages = _AGENT_READY_MESSAGES[agent_name]
             return agent_messages.get(current_step, agent_messages["default"])
 
         # Fallback for unknown agents
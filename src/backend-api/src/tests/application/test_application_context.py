@@ -1,6 +1,5 @@
 from azure.identity import DefaultAzureCredential
 
-from libs.application.application_configuration import Configuration
 from libs.application.application_context import AppContext
 
 
@@ -9,9 +8,9 @@ def test_application_context():
     assert app_context is not None
 
 
-def test_application_context_configuration():
+def test_application_context_configuration(default_configuration):
     app_context = AppContext()
-    app_context.set_configuration(Configuration())
+    app_context.set_configuration(default_configuration)
     assert app_context.configuration is not None
     assert (
         app_context.configuration.app_sample_variable
@@ -2,7 +2,6 @@ from unittest.mock import Mock
 
 import pytest
 
-from libs.application.application_configuration import Configuration
 from libs.application.application_context import AppContext
 from libs.services.implementations import (
     ConsoleLoggerService,
@@ -12,10 +11,10 @@ from libs.services.implementations import (
 from libs.services.interfaces import IDataService, IHttpService, ILoggerService
 
 
-def test_app_context_dependency_injection():
+def test_app_context_dependency_injection(default_configuration):
     """Test basic dependency injection functionality"""
     app_context = AppContext()
-    app_context.set_configuration(Configuration())
+    app_context.set_configuration(default_configuration)
 
     # Register services
     app_context.add_singleton(IDataService, InMemoryDataService)
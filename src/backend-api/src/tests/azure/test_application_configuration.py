@@ -24,3 +24,35 @@ def test_app_configuration_helper_read_and_set_environmental_variables():
     helper = AppConfigurationHelper(app_config_url)
     with pytest.raises(ClientAuthenticationError):
         list(helper.read_configuration())
+
+
+class _FakeSetting:
+    def __init__(self, key: str, value: str):
+        self.key = key
+        self.value = value
+
+
+class _FakeAppConfigClient:
+    def __init__(self, settings: list[_FakeSetting]):
+        self._settings = settings
+
+    def list_configuration_settings(self):
+        # The real client returns a lazy pager, not a list
+        return iter(self._settings)
+
+
+def test_app_configuration_helper_sets_environment_from_settings(monkeypatch):
+    helper = AppConfigurationHelper.__new__(AppConfigurationHelper)
+    helper.app_config_client = _FakeAppConfigClient(
+        [
+            _FakeSetting("TEST_APP_CONFIG_KEY_ONE", "one"),
+            _FakeSetting("TEST_APP_CONFIG_KEY_TWO", "two"),
+        ]
+    )
+    monkeypatch.setenv("TEST_APP_CONFIG_KEY_ONE", "")
+    monkeypatch.setenv("TEST_APP_CONFIG_KEY_TWO", "")
+
+    env = helper.read_and_set_environmental_variables()
+
+    assert env["TEST_APP_CONFIG_KEY_ONE"] == "one"
+    assert env["TEST_APP_CONFIG_KEY_TWO"] == "two"
@@ -0,0 +1,14 @@
+import pytest
+
+from libs.application.application_configuration import Configuration
+
+
+@pytest.fixture(scope="session")
+def default_configuration() -> Configuration:
+    """
+    Shared default Configuration for tests that only read settings.
+    Building Configuration() scans the environment and validates every field,
+    so read-only tests reuse a single instance. Tests that mutate the
+    configuration or depend on environment overrides should build their own.
+    """
+    return Configuration()
@@ -0,0 +1,190 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sas.cosmosdb.sql.repository import RepositoryBase
+
+from libs.repositories import process_status_repository
+from libs.repositories.process_status_repository import ProcessStatusRepository
+from routers.models.process_agent_activities import AgentActivity, ProcessStatus
+
+STARTED_AT = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+class FakeClock:
+    """Stands in for the module's time import so cache ages can be stepped."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is set by the test."""
+
+    current = STARTED_AT
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    process_status_repository._snapshot_cache.clear()
+    process_status_repository._inflight_reads.clear()
+    process_status_repository._agent_views_cache.clear()
+    yield
+    process_status_repository._snapshot_cache.clear()
+    process_status_repository._inflight_reads.clear()
+    process_status_repository._agent_views_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(process_status_repository, "time", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def repository(monkeypatch) -> ProcessStatusRepository:
+    """Repository with no Cosmos DB connection; tests replace get_async."""
+    monkeypatch.setattr(RepositoryBase, "__init__", lambda self, **kwargs: None)
+    return ProcessStatusRepository(
+        account_url="https://example.documents.azure.com",
+        database_name="db",
+        container_name="processes",
+        cache_ttl_seconds=2.0,
+        cache_swr_seconds=10.0,
+    )
+
+
+def _process(process_id: str = "p1", **kwargs) -> ProcessStatus:
+    return ProcessStatus(id=process_id, phase="Analysis", **kwargs)
+
+
+def test_render_agent_status_recomputes_durations_for_unchanged_snapshot(
+    repository, clock, monkeypatch
+):
+    """Durations keep moving while the same cached snapshot is rendered"""
+    snapshot = _process(
+        agents={
+            "Azure_Expert": AgentActivity(
+                name="Azure_Expert",
+                is_active=True,
+                participation_status="ready",
+                last_update_time=STARTED_AT.strftime("%Y-%m-%d %H:%M:%S UTC"),
+            )
+        }
+    )
+    fetches = []
+
+    async def get_async(process_id):
+        fetches.append(process_id)
+        return snapshot
+
+    repository.get_async = get_async
+    monkeypatch.setattr(process_status_repository, "datetime", FrozenDatetime)
+
+    async def render_at(seconds_after_start: int) -> str:
+        FrozenDatetime.current = STARTED_AT + timedelta(seconds=seconds_after_start)
+        rendered = await repository.render_agent_status("p1")
+        return rendered["agents"][0]
+
+    first = asyncio.run(render_at(45))
+    second = asyncio.run(render_at(100))
+
+    assert fetches == ["p1"]
+    assert first.endswith("(45s)")
+    assert second.endswith("(1m 40s)")
+
+
+class FakeStore:
+    """Fake get_async that counts reads and can be switched to fail."""
+
+    def __init__(self, *snapshots: ProcessStatus):
+        self.snapshots = list(snapshots)
+        self.reads = 0
+        self.error: Exception | None = None
+
+    async def get_async(self, process_id):
+        self.reads += 1
+        # Yield once so concurrent callers can pile up behind this read
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        return self.snapshots[min(self.reads, len(self.snapshots)) - 1]
+
+
+def test_read_within_ttl_does_not_fetch(repository, clock):
+    store = FakeStore(_process())
+    repository.get_async = store.get_async
+
+    async def run():
+        first = await repository._get_cached_async("p1")
+        clock.advance(1.5)
+        second = await repository._get_cached_async("p1")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert store.reads == 1
+    assert second is first
+
+
+def test_stale_read_serves_snapshot_and_schedules_one_refresh(repository, clock):
+    old, new = _process(status="running"), _process(status="completed")
+    store = FakeStore(old, new)
+    repository.get_async = store.get_async
+
+    async def run():
+        await repository._get_cached_async("p1")
+        clock.advance(5.0)  # past the TTL, inside the SWR window
+        stale_reads = [await repository._get_cached_async("p1") for _ in range(3)]
+        await process_status_repository._inflight_reads["p1"]
+        return stale_reads, await repository._get_cached_async("p1")
+
+    stale_reads, refreshed = asyncio.run(run())
+
+    assert all(snapshot is old for snapshot in stale_reads)
+    assert store.reads == 2
+    assert refreshed is new
+
+
+def test_concurrent_cold_reads_share_one_fetch(repository, clock):
+    store = FakeStore(_process())
+    repository.get_async = store.get_async
+
+    async def run():
+        return await asyncio.gather(
+            *(repository._get_cached_async("p1") for _ in range(10))
+        )
+
+    results = asyncio.run(run())
+
+    assert store.reads == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_fetch_error_serves_stale_snapshot_up_to_limit(repository, clock):
+    snapshot = _process()
+    store = FakeStore(snapshot)
+    repository.get_async = store.get_async
+
+    async def run():
+        await repository._get_cached_async("p1")
+        store.error = RuntimeError("429 Too Many Requests")
+        clock.advance(60.0)  # past TTL + SWR, so the read is blocking
+        within_limit = await repository._get_cached_async("p1")
+        clock.advance(61.0)  # 121s since the last successful read
+        with pytest.raises(RuntimeError):
+            await repository._get_cached_async("p1")
+        return within_limit
+
+    assert asyncio.run(run()) is snapshot
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 import inspect
 from pathlib import Path
 
@@ -54,5 +55,11 @@ def load_prompt_text(phase: MigrationPhase | str | None = None) -> str:
     agent_directory = caller_file.parent
     prompt_path = agent_directory / prompt_filename
 
+    return _read_prompt_file(prompt_path)
+
+
+@lru_cache(maxsize=128)
+def _read_prompt_file(prompt_path: Path) -> str:
+    """Read a prompt file once; prompt files ship with the image and don't change."""
     with open(prompt_path, encoding="utf-8") as file:
         return file.read().strip()
@@ -52,6 +52,9 @@ class Configuration(_configuration_base):
     storage_queue_name: str = Field(
         default="processes-queue", alias="STORAGE_QUEUE_NAME"
     )
+    telemetry_max_inflight: int = Field(
+        default=32, ge=1, alias="TELEMETRY_MAX_INFLIGHT"
+    )
 
 
 class _envConfiguration(_configuration_base):
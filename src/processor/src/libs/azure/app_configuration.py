@@ -66,8 +66,7 @@ class AppConfigurationHelper:
             dict: A dictionary of environment variables set from the configuration settings.
         """
         configuration_settings = self.read_configuration()
-        # Iterate through all configuration settings and set them as environment variables
-        for item in configuration_settings:
-            os.environ[item.key] = item.value
+        # Stream all configuration settings into the environment without an intermediate list
+        os.environ.update((item.key, item.value) for item in configuration_settings)
 
         return os.environ
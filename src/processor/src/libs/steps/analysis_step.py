@@ -13,7 +13,6 @@ import asyncio
 import time
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
 from pydantic import BaseModel, Field, ValidationError
 from semantic_kernel.agents import GroupChatOrchestration
 
@@ -39,6 +38,7 @@ from plugins.mcp_server import MCPBlobIOPlugin, MCPDatetimePlugin, MCPMicrosoftD
 from utils.agent_telemetry import TelemetryManager
 from utils.logging_utils import create_migration_logger, safe_log
 from utils.mcp_context import PluginContext, with_name
+from utils.template_util import get_template
 from utils.tool_tracking import ToolTrackingMixin
 
 from .base_step_state import BaseStepState
@@ -889,7 +889,7 @@ class AnalysisStep(KernelProcessStep[AnalysisStepState], ToolTrackingMixin):
             """
 
             # Using Template and replace values
-            jinja_template = Template(analysis_task)
+            jinja_template = get_template(analysis_task)
             rendered_task = jinja_template.render(
                 process_id=process_id,
                 source_file_folder=source_file_folder,
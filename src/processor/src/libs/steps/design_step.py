@@ -11,7 +11,6 @@ Following SK Process Framework best practices:
 
 from typing import Any
 
-from jinja2 import Template
 from pydantic import BaseModel, Field, computed_field
 from semantic_kernel.agents import GroupChatOrchestration
 from semantic_kernel.agents.runtime import InProcessRuntime
@@ -44,6 +43,7 @@ from plugins.mcp_server import MCPBlobIOPlugin, MCPDatetimePlugin, MCPMicrosoftD
 from utils.agent_telemetry import ProcessStatus, TelemetryManager
 from utils.logging_utils import create_migration_logger, safe_log
 from utils.mcp_context import PluginContext, with_name
+from utils.template_util import get_template
 from utils.tool_tracking import ToolTrackingMixin
 
 logger = create_migration_logger(__name__)
@@ -1159,7 +1159,7 @@ class DesignStep(KernelProcessStep[DesignStepState], ToolTrackingMixin):
             """
 
             # Using Template and replace values with comprehensive parameters
-            jinja_template = Template(design_task)
+            jinja_template = get_template(design_task)
             rendered_task = jinja_template.render(
                 # Core parameters
                 process_id=process_id,
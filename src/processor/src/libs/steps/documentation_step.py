@@ -11,7 +11,6 @@ Following SK Process Framework best practices:
 
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
 from pydantic import Field
 from semantic_kernel.agents import GroupChatOrchestration
 from semantic_kernel.agents.runtime import InProcessRuntime
@@ -41,6 +40,7 @@ from plugins.mcp_server import MCPBlobIOPlugin, MCPDatetimePlugin, MCPMicrosoftD
 from utils.agent_telemetry import TelemetryManager
 from utils.logging_utils import create_migration_logger, safe_log
 from utils.mcp_context import PluginContext, with_name
+from utils.template_util import get_template
 from utils.tool_tracking import ToolTrackingMixin
 
 logger = create_migration_logger(__name__)
@@ -978,7 +978,7 @@ class DocumentationStep(KernelProcessStep[DocumentationStepState], ToolTrackingM
                 )
 
             # Using Template with comprehensive parameters for enhanced documentation
-            jinja_template = Template(documentation_task)
+            jinja_template = get_template(documentation_task)
             rendered_task = jinja_template.render(
                 # Basic process parameters
                 process_id=process_id,
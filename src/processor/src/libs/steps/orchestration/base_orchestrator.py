@@ -17,7 +17,6 @@ Following SK Process Framework best practices:
 import logging
 from typing import Any
 
-from jinja2 import Template
 from semantic_kernel.agents import ChatCompletionAgent
 from semantic_kernel.agents.orchestration.group_chat import (
     BooleanResult,
@@ -32,6 +31,7 @@ from semantic_kernel.contents import AuthorRole, ChatHistory
 
 from plugins.mcp_server import MCPBlobIOPlugin, MCPDatetimePlugin, MCPMicrosoftDocs
 from utils.agent_telemetry import TelemetryManager
+from utils.template_util import get_template
 
 logger = logging.getLogger(__name__)
 
@@ -493,7 +493,7 @@ class StepSpecificGroupChatManager(GroupChatManager):
 
     async def _render_prompt(self, prompt: str, **kwargs) -> str:
         """Helper to render a prompt with arguments."""
-        template = Template(prompt)
+        template = get_template(prompt)
         return template.render(
             step_name=self.step_name, step_objective=self.step_objective, **kwargs
         )
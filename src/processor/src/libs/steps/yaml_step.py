@@ -11,7 +11,6 @@ Following SK Process Framework best practices:
 
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
 from pydantic import Field
 from semantic_kernel.agents import GroupChatOrchestration
 
@@ -45,6 +44,7 @@ from utils.agent_telemetry import (
 )
 from utils.logging_utils import create_migration_logger, safe_log
 from utils.mcp_context import PluginContext, with_name
+from utils.template_util import get_template
 from utils.tool_tracking import ToolTrackingMixin
 
 logger = create_migration_logger(__name__)
@@ -1064,7 +1064,7 @@ class YamlStep(KernelProcessStep[YamlStepState], ToolTrackingMixin):
             """
 
             # Using Template to replace values with enhanced parameters
-            jinja_template = Template(yaml_task)
+            jinja_template = get_template(yaml_task)
             rendered_task = jinja_template.render(
                 process_id=process_id,
                 source_file_folder=source_file_folder,
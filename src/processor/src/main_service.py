@@ -18,6 +18,15 @@ from services.queue_service import (
     QueueServiceConfig,
 )
 
+try:
+    # Optional libuv-backed event loop; cuts per-iteration overhead for the
+    # many small queue, Cosmos DB and telemetry calls this service makes.
+    import uvloop
+
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -253,4 +262,4 @@ async def run_queue_service(
 if __name__ == "__main__":
     # Allow debug mode to be controlled by environment variable
     debug_mode = True
-    asyncio.run(run_queue_service(debug_mode=debug_mode))
+    asyncio.run(run_queue_service(debug_mode=debug_mode), loop_factory=_loop_factory)
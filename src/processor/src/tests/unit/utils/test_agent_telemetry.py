@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from src.libs.application.application_configuration import Configuration
+from src.libs.application.application_context import AppContext
+from src.utils import agent_telemetry
+from src.utils.agent_telemetry import ProcessStatus, TelemetryManager
+
+
+class StatusCodeError(Exception):
+    """Storage error carrying an HTTP status code, like Cosmos DB errors do."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"Storage returned {status_code}")
+        self.status_code = status_code
+
+
+def _copy(entity: ProcessStatus) -> ProcessStatus:
+    # model_copy(deep=True) can't copy the lock RootEntityBase keeps per instance
+    return ProcessStatus.model_validate(entity.model_dump())
+
+
+class FakeRepository:
+    """In-memory stand-in for AgentActivityRepository.
+
+    Mirrors sas-cosmosdb's RepositoryBase: writes return None, and adding an
+    existing id or updating a missing one raises ValueError. Every call yields
+    to the event loop once so concurrent callers interleave the way they would
+    against a real database.
+    """
+
+    def __init__(self):
+        self.documents: dict[str, ProcessStatus] = {}
+        self.reads = 0
+        self.updates = 0
+        self.update_errors: list[Exception] = []
+        self.read_delay = 0.0
+        self.reads_in_flight = 0
+        self.max_reads_in_flight = 0
+
+    async def add_async(self, entity: ProcessStatus) -> None:
+        await asyncio.sleep(0)
+        if entity.id in self.documents:
+            raise ValueError(f"Entity with ID '{entity.id}' already exists")
+        self.documents[entity.id] = _copy(entity)
+
+    async def get_async(self, key: str) -> ProcessStatus | None:
+        self.reads += 1
+        self.reads_in_flight += 1
+        self.max_reads_in_flight = max(self.max_reads_in_flight, self.reads_in_flight)
+        try:
+            await asyncio.sleep(self.read_delay)
+        finally:
+            self.reads_in_flight -= 1
+        document = self.documents.get(key)
+        return _copy(document) if document else None
+
+    async def update_async(self, entity: ProcessStatus) -> None:
+        self.updates += 1
+        await asyncio.sleep(0)
+        if self.update_errors:
+            raise self.update_errors.pop(0)
+        if entity.id not in self.documents:
+            raise ValueError(f"Entity with ID '{entity.id}' not found")
+        self.documents[entity.id] = _copy(entity)
+
+
+@pytest.fixture(autouse=True)
+def clear_process_cache():
+    agent_telemetry._process_cache.clear()
+    yield
+    agent_telemetry._process_cache.clear()
+
+
+@pytest.fixture
+def repository() -> FakeRepository:
+    return FakeRepository()
+
+
+@pytest.fixture
+def telemetry(repository) -> TelemetryManager:
+    manager = TelemetryManager()
+    manager.repository = repository
+    return manager
+
+
+def test_update_uses_cached_process(telemetry, repository):
+    async def run():
+        await telemetry.init_process("p1", "analysis", "analysis")
+        await telemetry.update_agent_activity("p1", "Azure_Expert", "thinking")
+
+    asyncio.run(run())
+
+    assert repository.reads == 0
+    agent = repository.documents["p1"].agents["Azure_Expert"]
+    assert agent.participation_status == "thinking"
+
+
+def test_failed_save_evicts_cached_process(telemetry, repository):
+    async def run():
+        await telemetry.init_process("p1", "analysis", "analysis")
+        repository.update_errors.append(StatusCodeError(400))
+        await telemetry.update_agent_activity("p1", "Azure_Expert", "thinking")
+        assert "p1" not in agent_telemetry._process_cache
+        return await telemetry.get_current_process("p1")
+
+    reloaded = asyncio.run(run())
+
+    assert repository.reads == 1
+    assert "Azure_Expert" not in reloaded.agents
+
+
+def test_reads_see_writes_from_other_workers(telemetry, repository):
+    async def run():
+        await telemetry.init_process("p1", "analysis", "analysis")
+        # Another replica moves the process on behind this worker's cache
+        repository.documents["p1"].status = "completed"
+        return await telemetry.get_current_process("p1")
+
+    process = asyncio.run(run())
+
+    assert process.status == "completed"
+    assert agent_telemetry._process_cache["p1"].status == "running"
+
+
+def test_concurrent_updates_on_one_process_keep_both_changes(telemetry, repository):
+    async def run():
+        await telemetry.init_process("p1", "analysis", "analysis")
+        # Start from storage so both writers have to load the document
+        agent_telemetry._process_cache.clear()
+        await asyncio.gather(
+            telemetry.update_agent_activity("p1", "Azure_Expert", "thinking"),
+            telemetry.update_agent_activity("p1", "EKS_Expert", "speaking"),
+        )
+
+    asyncio.run(run())
+
+    agents = repository.documents["p1"].agents
+    assert agents["Azure_Expert"].current_action == "thinking"
+    assert agents["EKS_Expert"].current_action == "speaking"
+
+
+def test_repository_reads_respect_max_inflight(repository):
+    app_context = AppContext()
+    app_context.set_configuration(Configuration(telemetry_max_inflight=2))
+    telemetry = TelemetryManager(app_context)
+    telemetry.repository = repository
+    for index in range(6):
+        repository.documents[f"p{index}"] = ProcessStatus(id=f"p{index}")
+    repository.read_delay = 0.01
+
+    async def run():
+        await asyncio.gather(
+            *(telemetry._load_process(f"p{index}") for index in range(6))
+        )
+
+    asyncio.run(run())
+
+    assert repository.reads == 6
+    assert repository.max_reads_in_flight == 2
+
+
+def test_locks_are_rebound_for_each_event_loop(telemetry, repository):
+    async def run():
+        await telemetry.init_process("p1", "analysis", "analysis")
+        # Contend the process lock so it binds to this loop
+        await asyncio.gather(
+            telemetry.update_agent_activity("p1", "Azure_Expert", "thinking"),
+            telemetry.update_agent_activity("p1", "EKS_Expert", "speaking"),
+        )
+        return telemetry._sync(), asyncio.get_running_loop()
+
+    first_sync, first_loop = asyncio.run(run())
+    second_sync, second_loop = asyncio.run(run())
+
+    assert first_sync.loop is first_loop
+    assert second_sync.loop is second_loop
+    assert second_sync is not first_sync
+
+
+def test_init_process_overwrites_existing_document(telemetry, repository):
+    stale = ProcessStatus(id="p1", phase="design", status="failed")
+    repository.documents["p1"] = stale
+
+    asyncio.run(telemetry.init_process("p1", "analysis", "analysis"))
+
+    document = repository.documents["p1"]
+    assert (document.phase, document.status) == ("analysis", "running")
+    assert repository.updates == 1
+
+
+@pytest.mark.parametrize("status_code", [408, 429, 503, 400])
+def test_failed_writes_are_not_retried(telemetry, repository, status_code):
+    # RepositoryBase retries transient errors itself before raising
+    repository.documents["p1"] = ProcessStatus(id="p1")
+    repository.update_errors = [StatusCodeError(status_code)]
+
+    with pytest.raises(StatusCodeError):
+        asyncio.run(telemetry._write(repository.update_async, ProcessStatus(id="p1")))
+
+    assert repository.updates == 1
@@ -1,7 +1,6 @@
 from enum import Enum
 from typing import Any, cast
 
-from jinja2 import Template
 from pydantic import BaseModel, Field
 from semantic_kernel.agents import (
     Agent,
@@ -30,6 +29,7 @@ from semantic_kernel.functions import KernelPlugin
 
 from libs.base.KernelAgent import semantic_kernel_agent
 from libs.base.SKLogicBase import SKLogicBase
+from utils.template_util import get_template
 
 
 class AgentType(str, Enum):
@@ -47,7 +47,7 @@ class agent_info(BaseModel):
 
     @staticmethod
     def update_prompt(template: str, **kwargs):
-        return Template(template).render(**kwargs)
+        return get_template(template).render(**kwargs)
 
     def render(self, **kwargs) -> "agent_info":
         """Simple template rendering method"""
@@ -55,14 +55,16 @@ class agent_info(BaseModel):
         if self.agent_system_prompt and (
             "{{" in self.agent_system_prompt or "{%" in self.agent_system_prompt
         ):
-            self.agent_system_prompt = Template(self.agent_system_prompt).render(
+            self.agent_system_prompt = get_template(self.agent_system_prompt).render(
                 **kwargs
             )
         # Render agent_instruction if it exists and contains templates
         if self.agent_instruction and (
             "{{" in self.agent_instruction or "{%" in self.agent_instruction
         ):
-            self.agent_instruction = Template(self.agent_instruction).render(**kwargs)
+            self.agent_instruction = get_template(self.agent_instruction).render(
+                **kwargs
+            )
         return self
 
 
@@ -2,7 +2,8 @@
 Clean Telemetry Manager for Agent Activity Tracking
 
 This module provides a clean telemetry system for tracking agent activities during migration processes.
-No global variables, no locks - just clean async/await based functions with a telemetry manager.
+Writers serialize per process and share a write-through cache of process documents;
+read APIs always go to storage.
 
 Usage:
     telemetry = TelemetryManager(app_context)
@@ -11,6 +12,8 @@ Usage:
 """
 
 import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 import logging
 from typing import Any
@@ -18,20 +21,79 @@ from typing import Any
 from pydantic import Field
 from sas.cosmosdb.sql import EntityBase, RepositoryBase, RootEntityBase
 
+from libs.application.application_configuration import Configuration
 from libs.application.application_context import AppContext
 
 logger = logging.getLogger(__name__)
 
 
-def get_orchestration_agents() -> set[str]:
-    """Get orchestration agent names - consolidated to single conversation manager."""
-    return {
+_ORCHESTRATION_AGENTS: frozenset[str] = frozenset(
+    {
         # Single conversation manager for all expert discussions and orchestration
         "Conversation_Manager",
         "Agent_Selector",
         # Note: Consolidated from System, Orchestration_Manager, Agent_Selector
         # Provides clean, conversation-focused telemetry that users understand
     }
+)
+
+
+# Agent actions that map onto the thinking / speaking participation states
+_THINKING_ACTIONS: frozenset[str] = frozenset({"thinking", "analyzing", "processing"})
+_SPEAKING_ACTIONS: frozenset[str] = frozenset({"speaking", "responding", "explaining"})
+
+# Ready-message lookup for _get_ready_status_message. Phases are matched by
+# substring in this order; each phase maps to (agent-name token, message for
+# that agent, default message template).
+_PHASE_TOKENS = ("analysis", "design", "yaml", "documentation")
+_COORDINATOR_READY_MESSAGES = {
+    "analysis": "Coordinating platform analysis expert discussion",
+    "design": "Coordinating Azure architecture expert discussion",
+    "yaml": "Coordinating YAML conversion expert discussion",
+    "documentation": "Coordinating migration documentation expert discussion",
+}
+_PHASE_READY_MESSAGES = {
+    "analysis": (
+        "system",
+        "Ready to analyze source platform",
+        "Ready to assist with {step} analysis",
+    ),
+    "design": (
+        "azure",
+        "Ready to provide Azure recommendations",
+        "Ready to assist with {step} design",
+    ),
+    "yaml": (
+        "yaml",
+        "Ready to generate YAML configurations",
+        "Ready to assist with {step} conversion",
+    ),
+    "documentation": (
+        "technical_writer",
+        "Ready to write comprehensive documentation",
+        "Ready to assist with {step} documentation",
+    ),
+}
+
+
+# Status icon and display-title mapping for render_agent_status
+_STATUS_ICONS = {
+    "speaking": "🗣️",
+    "thinking": "🤔",
+    "ready": "✅",
+    "standby": "⏸️",
+    "completed": "🏁",
+    "waiting": "⏳",
+}
+_STATUS_DISPLAY = {status: status.title() for status in _STATUS_ICONS}
+# Statuses / orchestration actions that render_agent_status treats as working
+_WORKING_STATUSES: frozenset[str] = frozenset({"thinking", "speaking"})
+_IDLE_ACTIONS: frozenset[str] = frozenset({"idle", "standby"})
+
+
+def get_orchestration_agents() -> frozenset[str]:
+    """Get orchestration agent names - consolidated to single conversation manager."""
+    return _ORCHESTRATION_AGENTS
 
 
 def get_common_agents() -> list[str]:
@@ -51,6 +113,21 @@ def _get_utc_timestamp() -> str:
     return datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
+# Per-agent caps for the history lists persisted on ProcessStatus. Every update
+# rewrites the whole document, so unbounded lists make long runs slower and
+# eventually push the item past the Cosmos DB size limit.
+MAX_ACTIVITY_HISTORY = 200
+MAX_REASONING_STEPS = 200
+
+
+def _append_bounded(items: list, item: Any, limit: int) -> None:
+    """Append item and drop the oldest entries beyond limit."""
+    items.append(item)
+    overflow = len(items) - limit
+    if overflow > 0:
+        del items[:overflow]
+
+
 class AgentActivityHistory(EntityBase):
     """Historical record of agent activity"""
 
@@ -133,13 +210,69 @@ class AgentActivityRepository(RepositoryBase[ProcessStatus, str]):
         )
 
 
+# Write-through cache of recently touched process documents, shared by every
+# TelemetryManager in this worker. It only backs the read-before-write inside
+# _process_guard, so consecutive updates from this worker skip a round trip;
+# read APIs go to storage so they see writes from other replicas.
+_PROCESS_CACHE_SIZE = 32
+_process_cache: OrderedDict[str, ProcessStatus] = OrderedDict()
+
+
+def _cache_process(process: ProcessStatus) -> None:
+    _process_cache[process.id] = process
+    _process_cache.move_to_end(process.id)
+    while len(_process_cache) > _PROCESS_CACHE_SIZE:
+        _process_cache.popitem(last=False)
+
+
+_PROCESS_LOCK_STRIPES = 16
+
+
+class _LoopSync:
+    """Process locks and the in-flight request semaphore for one event loop.
+
+    asyncio primitives bind to the loop that first waits on them, so they are
+    created on the running loop and replaced if a later asyncio.run starts a
+    new one.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_inflight: int):
+        self.loop = loop
+        # Upper bound on repository calls in flight across all processes, so a
+        # burst of concurrent migrations can't exhaust the Cosmos DB client's
+        # connection pool.
+        self.inflight_requests = asyncio.Semaphore(max_inflight)
+        # Every TelemetryManager writer does a load-modify-save on the process
+        # document, so writes for the same process must not interleave. Locks
+        # are striped by process_id so unrelated processes don't wait on each
+        # other.
+        self.process_locks = [asyncio.Lock() for _ in range(_PROCESS_LOCK_STRIPES)]
+
+    def process_lock(self, process_id: str) -> asyncio.Lock:
+        return self.process_locks[hash(process_id) % _PROCESS_LOCK_STRIPES]
+
+
+_loop_sync: _LoopSync | None = None
+
+
+def _get_loop_sync(max_inflight: int) -> _LoopSync:
+    global _loop_sync
+    loop = asyncio.get_running_loop()
+    if _loop_sync is None or _loop_sync.loop is not loop:
+        _loop_sync = _LoopSync(loop, max_inflight)
+    return _loop_sync
+
+
 class TelemetryManager:
-    """Clean telemetry manager for agent activity tracking."""
+    """Clean telemetry manager for agent activity tracking.
+
+    All work here is small async storage I/O, so it benefits directly from
+    running under uvloop, which main_service uses when it is installed.
+    """
 
     def __init__(self, app_context: AppContext | None = None):
         self.app_context = app_context
         # self.current_process: ProcessStatus | None = None
-        self._read_semaphore = asyncio.Semaphore(1)  # For thread-safe reads
 
         # Check if in development mode
         is_development = (
@@ -150,6 +283,13 @@ class TelemetryManager:
             or "localhost" in app_context.configuration.cosmos_db_account_url
         )
 
+        # Without an app configuration (development mode), use the setting's default
+        self._max_inflight = (
+            app_context.configuration.telemetry_max_inflight
+            if app_context and app_context.configuration
+            else Configuration.model_fields["telemetry_max_inflight"].default
+        )
+
         if is_development:
             logger.info("[TELEMETRY] Development mode - using in-memory telemetry")
             self.repository = None
@@ -167,7 +307,7 @@ class TelemetryManager:
         initial_agents = {}
 
         # Initialize orchestration agents
-        for agent_name in get_orchestration_agents():
+        for agent_name in _ORCHESTRATION_AGENTS:
             initial_agents[agent_name] = AgentActivity(
                 name=agent_name,
                 current_action="ready",
@@ -176,7 +316,7 @@ class TelemetryManager:
             )
 
         # Initialize core system agents (not actual responding agents)
-        for agent_name in get_orchestration_agents():
+        for agent_name in _ORCHESTRATION_AGENTS:
             initial_agents[agent_name] = AgentActivity(
                 name=agent_name,
                 current_action="ready",
@@ -198,11 +338,70 @@ class TelemetryManager:
         # Initialize in persistent storage if available
         if self.repository:
             try:
-                await self.repository.add_async(new_process)
+                try:
+                    await self._write(self.repository.add_async, new_process)
+                except ValueError:
+                    # add_async reports a 409 conflict as ValueError: the document
+                    # already exists (e.g. redelivered message) - overwrite it
+                    await self._write(self.repository.update_async, new_process)
+                _cache_process(new_process)
                 logger.info(f"[TELEMETRY] Initialized process {process_id} in storage")
             except Exception as e:
+                _process_cache.pop(process_id, None)
                 logger.error(f"Error initializing process telemetry: {e}")
 
+    def _sync(self) -> _LoopSync:
+        return _get_loop_sync(self._max_inflight)
+
+    @asynccontextmanager
+    async def _process_guard(self, process_id: str):
+        """Serialize load-modify-save sequences on one process document."""
+        async with self._sync().process_lock(process_id):
+            try:
+                yield
+            except BaseException:
+                # The cached document may hold half-applied, unsaved changes
+                _process_cache.pop(process_id, None)
+                raise
+
+    async def _fetch_process(self, process_id: str) -> ProcessStatus | None:
+        """Read the process document from storage, bypassing the cache."""
+        async with self._sync().inflight_requests:
+            return await self.repository.get_async(process_id)
+
+    async def _load_process(self, process_id: str) -> ProcessStatus | None:
+        """Return the process document for a writer, from the cache when possible.
+
+        Only call this inside _process_guard; the returned document is the cached
+        instance that the caller mutates and saves.
+        """
+        process = _process_cache.get(process_id)
+        if process is None:
+            process = await self._fetch_process(process_id)
+            if process:
+                _cache_process(process)
+        return process
+
+    async def _save_process(self, process: ProcessStatus) -> None:
+        """Persist a mutated process document and keep the cache coherent."""
+        try:
+            await self._write(self.repository.update_async, process)
+        except Exception:
+            # Cached copy holds unsaved changes - drop it so the next call re-reads
+            _process_cache.pop(process.id, None)
+            raise
+        _cache_process(process)
+
+    async def _write(self, operation, process: ProcessStatus) -> None:
+        """Run a repository write within the in-flight request limit.
+
+        Not retried here: RepositoryBase already retries throttling, timeout and
+        unavailable responses with backoff, and retrying again would hold the
+        process lock for every extra attempt.
+        """
+        async with self._sync().inflight_requests:
+            await operation(process)
+
     async def update_agent_activity(
         self,
         process_id: str,
@@ -214,82 +413,91 @@ class TelemetryManager:
         reset_for_new_step: bool = False,
     ):
         """Update agent activity."""
-        process_status: ProcessStatus | None = None
+        async with self._process_guard(process_id):
+            process_status: ProcessStatus | None = None
 
-        # Get Process Object First
-        if self.repository:
-            process_status = await self.repository.get_async(process_id)
+            # Get Process Object First
+            if self.repository:
+                process_status = await self._load_process(process_id)
 
-        if not process_status:
-            logger.warning("No current process - cannot update agent activity")
-            return
+            if not process_status:
+                logger.warning("No current process - cannot update agent activity")
+                return
 
-        # Set other agents to inactive (except orchestration agents)
-        for name, agent in process_status.agents.items():
-            if name != agent_name and name not in get_orchestration_agents():
-                agent.is_active = False
+            ts = _get_utc_timestamp()
 
-        # Update or create agent activity
-        if agent_name not in process_status.agents:
-            process_status.agents[agent_name] = AgentActivity(name=agent_name)
+            # Set other agents to inactive (except orchestration agents)
+            for name, agent in process_status.agents.items():
+                if name != agent_name and name not in _ORCHESTRATION_AGENTS:
+                    agent.is_active = False
 
-        agent = process_status.agents[agent_name]
+            # Update or create agent activity
+            if agent_name not in process_status.agents:
+                process_status.agents[agent_name] = AgentActivity(name=agent_name)
 
-        # Handle step reset
-        if reset_for_new_step:
-            agent.step_reset_count += 1
-            history_entry = AgentActivityHistory(
-                action=f"step_transition_to_{process_status.step}",
-                message_preview="Transitioning from previous step",
-                step=process_status.step,
-                tool_used="",
-            )
-            agent.activity_history.append(history_entry)
+            agent = process_status.agents[agent_name]
 
-        # Add current activity to history (with tool tracking support)
-        if agent.current_action != "idle" and agent.current_action != action:
-            tool_used_value = tool_name if tool_used and tool_name else ""
-            history_entry = AgentActivityHistory(
-                action=agent.current_action,
-                message_preview=agent.last_message_preview,
-                step=process_status.step,
-                tool_used=tool_used_value,
-            )
-            agent.activity_history.append(history_entry)
-
-        # Update current state
-        agent.current_action = action
-        agent.last_message_preview = message_preview
-        agent.last_update_time = _get_utc_timestamp()
-        agent.is_active = True
-
-        # Set participation status based on action (skip orchestration agents)
-        if agent_name not in get_orchestration_agents():
-            if action in ["thinking", "analyzing", "processing"]:
-                agent.participation_status = "thinking"
-                agent.is_currently_thinking = True
-                agent.is_currently_speaking = False
-            elif action in ["speaking", "responding", "explaining"]:
-                agent.participation_status = "speaking"
-                agent.is_currently_speaking = True
-                agent.is_currently_thinking = False
-            elif action == "completed":
-                agent.participation_status = "completed"
-                agent.is_currently_speaking = False
-                agent.is_currently_thinking = False
-            else:
-                agent.participation_status = "ready"
-                agent.is_currently_speaking = False
-                agent.is_currently_thinking = False
+            # Handle step reset
+            if reset_for_new_step:
+                agent.step_reset_count += 1
+                history_entry = AgentActivityHistory(
+                    timestamp=ts,
+                    action=f"step_transition_to_{process_status.step}",
+                    message_preview="Transitioning from previous step",
+                    step=process_status.step,
+                    tool_used="",
+                )
+                _append_bounded(
+                    agent.activity_history, history_entry, MAX_ACTIVITY_HISTORY
+                )
 
-        process_status.last_update_time = _get_utc_timestamp()
+            # Add current activity to history (with tool tracking support)
+            if agent.current_action != "idle" and agent.current_action != action:
+                tool_used_value = tool_name if tool_used and tool_name else ""
+                history_entry = AgentActivityHistory(
+                    timestamp=ts,
+                    action=agent.current_action,
+                    message_preview=agent.last_message_preview,
+                    step=process_status.step,
+                    tool_used=tool_used_value,
+                )
+                _append_bounded(
+                    agent.activity_history, history_entry, MAX_ACTIVITY_HISTORY
+                )
 
-        # Update persistent storage if available
-        if self.repository:
-            try:
-                await self.repository.update_async(process_status)
-            except Exception as e:
-                logger.error(f"Error updating agent activity: {e}")
+            # Update current state
+            agent.current_action = action
+            agent.last_message_preview = message_preview
+            agent.last_update_time = ts
+            agent.is_active = True
+
+            # Set participation status based on action (skip orchestration agents)
+            if agent_name not in _ORCHESTRATION_AGENTS:
+                if action in _THINKING_ACTIONS:
+                    agent.participation_status = "thinking"
+                    agent.is_currently_thinking = True
+                    agent.is_currently_speaking = False
+                elif action in _SPEAKING_ACTIONS:
+                    agent.participation_status = "speaking"
+                    agent.is_currently_speaking = True
+                    agent.is_currently_thinking = False
+                elif action == "completed":
+                    agent.participation_status = "completed"
+                    agent.is_currently_speaking = False
+                    agent.is_currently_thinking = False
+                else:
+                    agent.participation_status = "ready"
+                    agent.is_currently_speaking = False
+                    agent.is_currently_thinking = False
+
+            process_status.last_update_time = ts
+
+            # Update persistent storage if available
+            if self.repository:
+                try:
+                    await self._save_process(process_status)
+                except Exception as e:
+                    logger.error(f"Error updating agent activity: {e}")
 
     async def track_tool_usage(
         self,
@@ -310,141 +518,153 @@ class TelemetryManager:
             tool_details: Additional details about the tool call (e.g., parameters, context)
             tool_result_preview: Brief preview of the tool result (first 100 chars)
         """
-        process_status: ProcessStatus | None = None
+        async with self._process_guard(process_id):
+            process_status: ProcessStatus | None = None
 
-        # Get Process Object First
-        if self.repository:
-            process_status = await self.repository.get_async(process_id)
+            # Get Process Object First
+            if self.repository:
+                process_status = await self._load_process(process_id)
 
-        if not process_status:
-            logger.warning(f"No current process {process_id} - cannot track tool usage")
-            return
+            if not process_status:
+                logger.warning(
+                    f"No current process {process_id} - cannot track tool usage"
+                )
+                return
 
-        # Update or create agent activity
-        if agent_name not in process_status.agents:
-            process_status.agents[agent_name] = AgentActivity(name=agent_name)
+            ts = _get_utc_timestamp()
 
-        agent = process_status.agents[agent_name]
+            # Update or create agent activity
+            if agent_name not in process_status.agents:
+                process_status.agents[agent_name] = AgentActivity(name=agent_name)
 
-        # Create tool usage history entry
-        tool_usage_summary = f"Used {tool_name}.{tool_action}"
-        if tool_details:
-            tool_usage_summary += (
-                f" ({tool_details[:50]}{'...' if len(tool_details) > 50 else ''})"
-            )
+            agent = process_status.agents[agent_name]
 
-        history_entry = AgentActivityHistory(
-            action="tool_usage",
-            message_preview=tool_usage_summary,
-            step=process_status.step,
-            tool_used=f"{tool_name}.{tool_action}",
-        )
-        agent.activity_history.append(history_entry)
+            # Create tool usage history entry
+            tool_usage_summary = f"Used {tool_name}.{tool_action}"
+            if tool_details:
+                tool_usage_summary += (
+                    f" ({tool_details[:50]}{'...' if len(tool_details) > 50 else ''})"
+                )
 
-        # Update current activity to reflect tool usage
-        agent.current_action = "using_tool"
-        agent.last_message_preview = f"Using {tool_name} - {tool_action}"
-        agent.last_update_time = _get_utc_timestamp()
-        agent.is_active = True
+            history_entry = AgentActivityHistory(
+                timestamp=ts,
+                action="tool_usage",
+                message_preview=tool_usage_summary,
+                step=process_status.step,
+                tool_used=f"{tool_name}.{tool_action}",
+            )
+            _append_bounded(agent.activity_history, history_entry, MAX_ACTIVITY_HISTORY)
 
-        # Add to reasoning steps for context
-        reasoning_step = f"🔧 Tool: {tool_name}.{tool_action}"
-        if tool_result_preview:
-            reasoning_step += f" → {tool_result_preview[:100]}{'...' if len(tool_result_preview) > 100 else ''}"
-        agent.reasoning_steps.append(reasoning_step)
+            # Update current activity to reflect tool usage
+            agent.current_action = "using_tool"
+            agent.last_message_preview = f"Using {tool_name} - {tool_action}"
+            agent.last_update_time = ts
+            agent.is_active = True
 
-        process_status.last_update_time = _get_utc_timestamp()
+            # Add to reasoning steps for context
+            reasoning_step = f"🔧 Tool: {tool_name}.{tool_action}"
+            if tool_result_preview:
+                reasoning_step += f" → {tool_result_preview[:100]}{'...' if len(tool_result_preview) > 100 else ''}"
+            _append_bounded(agent.reasoning_steps, reasoning_step, MAX_REASONING_STEPS)
 
-        # Update persistent storage if available
-        if self.repository:
-            try:
-                await self.repository.update_async(process_status)
-                logger.info(
-                    f"[TOOL_TRACKING] {agent_name} used {tool_name}.{tool_action}"
-                )
-            except Exception as e:
-                logger.error(f"Error tracking tool usage: {e}")
+            process_status.last_update_time = ts
+
+            # Update persistent storage if available
+            if self.repository:
+                try:
+                    await self._save_process(process_status)
+                    logger.info(
+                        f"[TOOL_TRACKING] {agent_name} used {tool_name}.{tool_action}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error tracking tool usage: {e}")
 
     async def update_process_status(self, process_id: str, status: str):
         """Update the overall process status."""
-        # if self.current_process:
-        #     self.current_process.status = status
-        #     self.current_process.last_update_time = _get_utc_timestamp()
-        current_process: ProcessStatus | None = None
-
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if current_process:
-                current_process.last_update_time = _get_utc_timestamp()
-                current_process.status = status
-                await self.repository.update_async(current_process)
-
-        # if current_process:
-        #     current_process.status = status
-        #     current_process.last_update_time = _get_utc_timestamp()
-        #     if self.repository:
-        #         try:
-        #             await self.repository.update_async(self.current_process)
-        #         except Exception as e:
-        #             logger.error(f"Error updating process status: {e}")
+        async with self._process_guard(process_id):
+            # if self.current_process:
+            #     self.current_process.status = status
+            #     self.current_process.last_update_time = _get_utc_timestamp()
+            current_process: ProcessStatus | None = None
+
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if current_process:
+                    current_process.last_update_time = _get_utc_timestamp()
+                    current_process.status = status
+                    await self._save_process(current_process)
+
+            # if current_process:
+            #     current_process.status = status
+            #     current_process.last_update_time = _get_utc_timestamp()
+            #     if self.repository:
+            #         try:
+            #             await self.repository.update_async(self.current_process)
+            #         except Exception as e:
+            #             logger.error(f"Error updating process status: {e}")
 
     async def set_agent_idle(self, process_id: str, agent_name: str):
         """Set an agent to idle state."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process or agent_name not in current_process.agents:
-                return
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process or agent_name not in current_process.agents:
+                    return
 
-        if current_process:
-            agent = current_process.agents[agent_name]
-            agent.current_action = "idle"
-            agent.is_active = False
-            agent.is_currently_thinking = False
-            agent.is_currently_speaking = False
-            agent.participation_status = "standby"
-            agent.last_update_time = _get_utc_timestamp()
+            if current_process:
+                agent = current_process.agents[agent_name]
+                agent.current_action = "idle"
+                agent.is_active = False
+                agent.is_currently_thinking = False
+                agent.is_currently_speaking = False
+                agent.participation_status = "standby"
+                agent.last_update_time = _get_utc_timestamp()
 
-        if self.repository:
-            try:
-                await self.repository.update_async(current_process)
-            except Exception as e:
-                logger.error(f"Error setting agent idle: {e}")
+            if self.repository:
+                try:
+                    await self._save_process(current_process)
+                except Exception as e:
+                    logger.error(f"Error setting agent idle: {e}")
 
     async def transition_to_phase(self, process_id: str, phase: str, step: str):
         """Clean transition between phases with proper agent cleanup."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                logger.warning("No current process - cannot transition phase")
-                return
-            else:
-                # Update phase and step
-                old_phase = current_process.phase
-                current_process.phase = phase
-                current_process.step = step
-                current_process.last_update_time = _get_utc_timestamp()
-
-                for agent_name, agent in current_process.agents.items():
-                    if (
-                        agent_name not in get_orchestration_agents()
-                    ):  # Skip system agents
-                        agent.participation_status = "ready"
-                        agent.current_action = "ready"
-                        agent.last_message_preview = f"Ready for {phase.lower()} phase"
-                        agent.last_update_time = _get_utc_timestamp()
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    logger.warning("No current process - cannot transition phase")
+                    return
+                else:
+                    # Update phase and step
+                    old_phase = current_process.phase
+                    current_process.phase = phase
+                    current_process.step = step
+                    ts = _get_utc_timestamp()
+                    current_process.last_update_time = ts
+
+                    for agent_name, agent in current_process.agents.items():
+                        if (
+                            agent_name not in _ORCHESTRATION_AGENTS
+                        ):  # Skip system agents
+                            agent.participation_status = "ready"
+                            agent.current_action = "ready"
+                            agent.last_message_preview = (
+                                f"Ready for {phase.lower()} phase"
+                            )
+                            agent.last_update_time = ts
 
-                logger.info(
-                    f"[TELEMETRY] Transitioning to phase: {phase}, step: {step}"
-                )
-                try:
-                    await self.repository.update_async(current_process)
                     logger.info(
-                        f"[TELEMETRY] Phase transition completed: {old_phase} → {phase}"
+                        f"[TELEMETRY] Transitioning to phase: {phase}, step: {step}"
                     )
-                except Exception as e:
-                    logger.error(f"Error updating phase transition: {e}")
+                    try:
+                        await self._save_process(current_process)
+                        logger.info(
+                            f"[TELEMETRY] Phase transition completed: {old_phase} → {phase}"
+                        )
+                    except Exception as e:
+                        logger.error(f"Error updating phase transition: {e}")
 
     # async def _cleanup_phase_agents(self, process_id: str, previous_phase: str):
     #     """Remove or mark inactive agents not relevant to current phase."""
@@ -457,47 +677,54 @@ class TelemetryManager:
 
     async def _initialize_phase_agents(self, process_id: str, phase: str):
         """Initialize agents relevant to the new phase."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                logger.warning("No current process - cannot initialize phase agents")
-                return
-            else:
-                # Note: We no longer pre-initialize agents.
-                # Agents will be added to telemetry when they actually respond via callbacks.
-                logger.info(f"[TELEMETRY] Phase initialization completed: {phase}")
-                # Update status for agents that already exist (have already responded)
-                for agent_name, agent in current_process.agents.items():
-                    if (
-                        agent_name not in get_orchestration_agents()
-                    ):  # Skip system agents
-                        agent.participation_status = "ready"
-                        agent.current_action = "ready"
-                        agent.last_message_preview = f"Ready for {phase.lower()} phase"
-                        agent.last_update_time = _get_utc_timestamp()
-
-                await self.repository.update_async(current_process)
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    logger.warning(
+                        "No current process - cannot initialize phase agents"
+                    )
+                    return
+                else:
+                    # Note: We no longer pre-initialize agents.
+                    # Agents will be added to telemetry when they actually respond via callbacks.
+                    logger.info(f"[TELEMETRY] Phase initialization completed: {phase}")
+                    # Update status for agents that already exist (have already responded)
+                    ts = _get_utc_timestamp()
+                    for agent_name, agent in current_process.agents.items():
+                        if (
+                            agent_name not in _ORCHESTRATION_AGENTS
+                        ):  # Skip system agents
+                            agent.participation_status = "ready"
+                            agent.current_action = "ready"
+                            agent.last_message_preview = (
+                                f"Ready for {phase.lower()} phase"
+                            )
+                            agent.last_update_time = ts
+
+                    await self._save_process(current_process)
 
     async def complete_all_participant_agents(self, process_id: str):
         """Mark all non-orchestration agents as completed."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                return
-            else:
-                for agent_name, agent in current_process.agents.items():
-                    if agent_name not in get_orchestration_agents():
-                        agent.current_action = "completed"
-                        agent.participation_status = "completed"
-                        agent.is_active = False
-                        agent.is_currently_thinking = False
-                        agent.is_currently_speaking = False
-                try:
-                    await self.repository.update_async(current_process)
-                except Exception as e:
-                    logger.error(f"Error completing agents: {e}")
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    return
+                else:
+                    for agent_name, agent in current_process.agents.items():
+                        if agent_name not in _ORCHESTRATION_AGENTS:
+                            agent.current_action = "completed"
+                            agent.participation_status = "completed"
+                            agent.is_active = False
+                            agent.is_currently_thinking = False
+                            agent.is_currently_speaking = False
+                    try:
+                        await self._save_process(current_process)
+                    except Exception as e:
+                        logger.error(f"Error completing agents: {e}")
 
     async def record_failure(
         self,
@@ -509,36 +736,37 @@ class TelemetryManager:
         stack_trace: str = "",
     ):
         """Record process failure information."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                return
-            else:
-                current_process.status = "failed"
-                current_process.failure_reason = failure_reason
-                current_process.failure_details = failure_details
-                current_process.failure_step = failure_step or current_process.step
-                current_process.failure_agent = failure_agent
-                current_process.failure_timestamp = _get_utc_timestamp()
-                current_process.stack_trace = stack_trace
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    return
+                else:
+                    current_process.status = "failed"
+                    current_process.failure_reason = failure_reason
+                    current_process.failure_details = failure_details
+                    current_process.failure_step = failure_step or current_process.step
+                    current_process.failure_agent = failure_agent
+                    current_process.failure_timestamp = _get_utc_timestamp()
+                    current_process.stack_trace = stack_trace
 
-                try:
-                    await self.repository.update_async(current_process)
-                except Exception as e:
-                    logger.error(f"Error recording failure: {e}")
+                    try:
+                        await self._save_process(current_process)
+                    except Exception as e:
+                        logger.error(f"Error recording failure: {e}")
 
     async def get_current_process(self, process_id: str) -> ProcessStatus | None:
         """Get the current process status."""
         if self.repository:
-            return await self.repository.get_async(process_id)
+            return await self._fetch_process(process_id)
 
     async def get_process_outcome(self, process_id: str) -> str:
         """Get a human-readable process outcome."""
         current_process: ProcessStatus | None = None
 
         if self.repository:
-            current_process = await self.repository.get_async(process_id)
+            current_process = await self._fetch_process(process_id)
             if not current_process:
                 return "No active process"
             else:
@@ -566,333 +794,300 @@ class TelemetryManager:
         phase_lower = current_phase.lower() if current_phase else "current"
         step_lower = current_step.lower() if current_step else phase_lower
 
+        phase_key = next(
+            (token for token in _PHASE_TOKENS if token in phase_lower), None
+        )
+
         # Special handling for consolidated conversation manager
         if agent_name == "Conversation_Manager":
-            if "analysis" in phase_lower:
-                return "Coordinating platform analysis expert discussion"
-            elif "design" in phase_lower:
-                return "Coordinating Azure architecture expert discussion"
-            elif "yaml" in phase_lower:
-                return "Coordinating YAML conversion expert discussion"
-            elif "documentation" in phase_lower:
-                return "Coordinating migration documentation expert discussion"
-            else:
-                return "Coordinating expert discussion for migration step"
+            return _COORDINATOR_READY_MESSAGES.get(
+                phase_key, "Coordinating expert discussion for migration step"
+            )
+
+        if phase_key is None:
+            return f"Ready for {phase_lower} tasks"
 
         # Phase-specific ready messages for domain expert agents
-        if "analysis" in phase_lower:
-            if "system" in agent_name.lower():
-                return "Ready to analyze source platform"
-            else:
-                return f"Ready to assist with {step_lower} analysis"
+        role_token, role_message, default_message = _PHASE_READY_MESSAGES[phase_key]
+        if role_token in agent_name.lower():
+            return role_message
+        return default_message.format(step=step_lower)
 
-        elif "design" in phase_lower:
-            if "azure" in agent_name.lower():
-                return "Ready to provide Azure recommendations"
-            else:
-                return f"Ready to assist with {step_lower} design"
+    async def render_agent_status(self, process_id: str) -> dict:
+        """Enhanced agent status rendering with context-aware messages."""
+        process_snapshot = await self.get_process_status_by_process_id(process_id)
 
-        elif "yaml" in phase_lower:
-            if "yaml" in agent_name.lower():
-                return "Ready to generate YAML configurations"
-            else:
-                return f"Ready to assist with {step_lower} conversion"
+        if not process_snapshot:
+            return {
+                "process_id": process_id,
+                "phase": "unknown",
+                "status": "not_found",
+                "agents": [],
+            }
 
-        elif "documentation" in phase_lower:
-            if "technical_writer" in agent_name.lower():
-                return "Ready to write comprehensive documentation"
-            else:
-                return f"Ready to assist with {step_lower} documentation"
+        formatted_lines = []
+
+        # Convert agents dict to list if needed
+        agents_list = []
+        if isinstance(process_snapshot.agents, dict):
+            agents_list = list(process_snapshot.agents.values())
         else:
-            return f"Ready for {phase_lower} tasks"
+            agents_list = process_snapshot.agents
 
-    async def render_agent_status(self, process_id: str) -> dict:
-        """Enhanced agent status rendering with context-aware messages."""
-        async with self._read_semaphore:
-            process_snapshot = await self.get_process_status_by_process_id(process_id)
+        phase_lower = (
+            process_snapshot.phase.lower() if process_snapshot.phase else "current"
+        )
+        ready_step = getattr(process_snapshot, "step", "") or process_snapshot.phase
+
+        for agent in agents_list:
+            # Read each agent attribute once; several branches below reuse them
+            name = agent.name
+            speaking_content = getattr(agent, "current_speaking_content", "")
+            last_message = getattr(agent, "last_message", "")
+            last_activity_summary = getattr(agent, "last_activity_summary", "")
+            current_action = getattr(agent, "current_action", "")
+            is_active = getattr(agent, "is_active", False)
+            is_orchestration_agent = name in _ORCHESTRATION_AGENTS
+
+            # Handle both participating_status and participation_status
+            status = getattr(
+                agent,
+                "participating_status",
+                getattr(agent, "participation_status", "ready"),
+            ).lower()
+            icon = _STATUS_ICONS.get(status, "❓")
+
+            # ENHANCED MESSAGE DISPLAY LOGIC
+            if name.lower() == "conversation_manager":
+                # Conversation Manager gets enhanced treatment for migration coordination
+                message = f'"{speaking_content or last_activity_summary or last_message or "Migration conversation continues..."}"'
+
+            elif getattr(agent, "is_currently_speaking", False) and speaking_content:
+                # Speaking agent - show actual content
+                message = f'"{speaking_content}"'
+
+                # Add word count if available
+                word_count = getattr(agent, "message_word_count", 0)
+                if word_count > 0:
+                    message += f" ({word_count} words)"
+
+            elif status == "thinking" and getattr(agent, "thinking_about", ""):
+                # Thinking agent - show specific thoughts
+                message = f'"{agent.thinking_about}"'
+
+            elif status == "ready":
+                # CONTEXT-AWARE READY MESSAGE
+                ready_message = self._get_ready_status_message(
+                    name, ready_step, process_snapshot.phase, status
+                )
+                message = f'"{ready_message}"'
 
-            if not process_snapshot:
-                return {
-                    "process_id": process_id,
-                    "phase": "unknown",
-                    "status": "not_found",
-                    "agents": [],
-                }
+            elif last_message:
+                # Show last message if available
+                message = f'"{last_message}"'
 
-            # Status icon mapping
-            status_icons = {
-                "speaking": "🗣️",
-                "thinking": "🤔",
-                "ready": "✅",
-                "standby": "⏸️",
-                "completed": "🏁",
-                "waiting": "⏳",
-            }
+            elif last_activity_summary:
+                # Show last activity summary
+                message = f'"{last_activity_summary}"'
+
+            elif status == "completed":
+                message = '"Task completed successfully"'
 
-            formatted_lines = []
+            elif status == "standby":
+                # Conversation_Manager is handled above, so every standby agent
+                # (orchestration or not) gets the same message here
+                message = f'"Standing by for {phase_lower} tasks"'
 
-            # Convert agents dict to list if needed
-            agents_list = []
-            if isinstance(process_snapshot.agents, dict):
-                agents_list = list(process_snapshot.agents.values())
             else:
-                agents_list = process_snapshot.agents
-
-            for agent in agents_list:
-                # Handle both participating_status and participation_status
-                status = getattr(
-                    agent,
-                    "participating_status",
-                    getattr(agent, "participation_status", "ready"),
-                ).lower()
-                icon = status_icons.get(status, "❓")
-
-                # ENHANCED MESSAGE DISPLAY LOGIC
-                if agent.name.lower() == "conversation_manager":
-                    # Conversation Manager gets enhanced treatment for migration coordination
-                    message = f'"{getattr(agent, "current_speaking_content", "") or getattr(agent, "last_activity_summary", "") or getattr(agent, "last_message", "") or "Migration conversation continues..."}"'
-
-                elif getattr(agent, "is_currently_speaking", False) and getattr(
-                    agent, "current_speaking_content", ""
-                ):
-                    # Speaking agent - show actual content
-                    content = agent.current_speaking_content
-                    message = f'"{content}"'
-
-                    # Add word count if available
-                    if (
-                        hasattr(agent, "message_word_count")
-                        and agent.message_word_count > 0
-                    ):
-                        message += f" ({agent.message_word_count} words)"
-
-                elif (
-                    status == "thinking"
-                    and hasattr(agent, "thinking_about")
-                    and getattr(agent, "thinking_about", "")
-                ):
-                    # Thinking agent - show specific thoughts
-                    message = f'"{agent.thinking_about}"'
-
-                elif status == "ready":
-                    # CONTEXT-AWARE READY MESSAGE
-                    ready_message = self._get_ready_status_message(
-                        agent.name,
-                        getattr(process_snapshot, "step", "") or process_snapshot.phase,
-                        process_snapshot.phase,
-                        status,
-                    )
-                    message = f'"{ready_message}"'
-
-                elif getattr(agent, "last_message", ""):
-                    # Show last message if available
-                    content = agent.last_message
-                    message = f'"{content}"'
-
-                elif getattr(agent, "last_activity_summary", ""):
-                    # Show last activity summary
-                    message = f'"{agent.last_activity_summary}"'
-
-                elif status == "completed":
-                    message = '"Task completed successfully"'
-
-                elif status == "standby":
-                    # Better standby messages for orchestration agents
-                    if agent.name in get_orchestration_agents():
-                        if agent.name == "Conversation_Manager":
-                            current_action = getattr(agent, "current_action", "")
-                            if current_action and current_action != "standby":
-                                message = (
-                                    f'"{current_action.replace("_", " ").title()}"'
-                                )
-                            else:
-                                phase = (
-                                    process_snapshot.phase.lower()
-                                    if process_snapshot.phase
-                                    else "current"
-                                )
-                                message = f'"Managing {phase} phase"'
-                        elif agent.name == "Conversation_Manager":
-                            message = '"Monitoring conversation flow"'
-                        else:
-                            phase = (
-                                process_snapshot.phase.lower()
-                                if process_snapshot.phase
-                                else "current"
-                            )
-                            message = f'"Standing by for {phase} tasks"'
-                    else:
-                        phase = (
-                            process_snapshot.phase.lower()
-                            if process_snapshot.phase
-                            else "current"
-                        )
-                        message = f'"Standing by for {phase} tasks"'
+                # Enhanced fallback
+                action = current_action or "waiting"
+                message = f'"{action.replace("_", " ").title()}"'
 
-                else:
-                    # Enhanced fallback
-                    action = getattr(agent, "current_action", "") or "waiting"
-                    message = f'"{action.replace("_", " ").title()}"'
-
-                # Format the display line - SIMPLIFIED FOR USER-FRIENDLY DISPLAY
-                agent_display_name = agent.name.replace("_", " ")
-                is_active = getattr(agent, "is_active", False)
-
-                # Simplified status display without confusing blocking information
-                status_display = status.title()
-
-                # Determine if agent is truly active/working
-                is_working = (
-                    is_active
-                    or status in ["thinking", "speaking"]
-                    or (
-                        agent.name in get_orchestration_agents()
-                        and getattr(agent, "current_action", "")
-                        not in ["idle", "standby"]
-                    )
-                )
+            # Format the display line - SIMPLIFIED FOR USER-FRIENDLY DISPLAY
+            agent_display_name = name.replace("_", " ")
 
-                # No additional time or blocking information to avoid confusion
-                line = f"{'✓' if is_working else '✗'}[{icon}] {agent_display_name}: {status_display} - {message}"
-                formatted_lines.append(line)
+            # Simplified status display without confusing blocking information
+            status_display = _STATUS_DISPLAY.get(status) or status.title()
 
-            return {
-                "process_id": process_id,
-                "phase": process_snapshot.phase,
-                "status": process_snapshot.status,
-                "step": getattr(process_snapshot, "step", ""),
-                "last_update_time": process_snapshot.last_update_time,
-                "started_at_time": process_snapshot.started_at_time,
-                "agents": formatted_lines,
-                "failure_reason": process_snapshot.failure_reason,
-                "failure_details": process_snapshot.failure_details,
-                "failure_step": process_snapshot.failure_step,
-                "failure_agent": process_snapshot.failure_agent,
-                "failure_timestamp": process_snapshot.failure_timestamp,
-                "stack_trace": process_snapshot.stack_trace,
-                "step_results": process_snapshot.step_results,
-                "final_outcome": process_snapshot.final_outcome,
-                "generated_files": process_snapshot.generated_files,
-                "conversion_metrics": process_snapshot.conversion_metrics,
-            }
+            # Determine if agent is truly active/working
+            is_working = (
+                is_active
+                or status in _WORKING_STATUSES
+                or (is_orchestration_agent and current_action not in _IDLE_ACTIONS)
+            )
+
+            # No additional time or blocking information to avoid confusion
+            line = f"{'✓' if is_working else '✗'}[{icon}] {agent_display_name}: {status_display} - {message}"
+            formatted_lines.append(line)
+
+        return {
+            "process_id": process_id,
+            "phase": process_snapshot.phase,
+            "status": process_snapshot.status,
+            "step": getattr(process_snapshot, "step", ""),
+            "last_update_time": process_snapshot.last_update_time,
+            "started_at_time": process_snapshot.started_at_time,
+            "agents": formatted_lines,
+            "failure_reason": process_snapshot.failure_reason,
+            "failure_details": process_snapshot.failure_details,
+            "failure_step": process_snapshot.failure_step,
+            "failure_agent": process_snapshot.failure_agent,
+            "failure_timestamp": process_snapshot.failure_timestamp,
+            "stack_trace": process_snapshot.stack_trace,
+            "step_results": process_snapshot.step_results,
+            "final_outcome": process_snapshot.final_outcome,
+            "generated_files": process_snapshot.generated_files,
+            "conversion_metrics": process_snapshot.conversion_metrics,
+        }
 
     async def record_step_result(
         self, process_id: str, step_name: str, step_result: dict
     ):
         """Record the result of a completed step."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                logger.warning(
-                    f"No current process - cannot record {step_name} step result"
-                )
-                return
-            else:
-                current_process.step_results[step_name] = {
-                    "result": step_result,
-                    "timestamp": _get_utc_timestamp(),
-                    "step_name": step_name,
-                }
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    logger.warning(
+                        f"No current process - cannot record {step_name} step result"
+                    )
+                    return
+                else:
+                    current_process.step_results[step_name] = {
+                        "result": step_result,
+                        "timestamp": _get_utc_timestamp(),
+                        "step_name": step_name,
+                    }
 
-                logger.info(f"[TELEMETRY] Recorded {step_name} step result")
+                    logger.info(f"[TELEMETRY] Recorded {step_name} step result")
 
-            try:
-                await self.repository.update_async(current_process)
-            except Exception as e:
-                logger.error(f"Error recording step result: {e}")
+                try:
+                    await self._save_process(current_process)
+                except Exception as e:
+                    logger.error(f"Error recording step result: {e}")
 
     async def record_final_outcome(
         self, process_id: str, outcome_data: dict, success: bool = True
     ):
         """Record the final migration outcome with comprehensive results."""
-        current_process: ProcessStatus | None = None
-        if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            if not current_process:
-                logger.warning("No current process - cannot record final outcome")
-                return
-            else:
-                # Extract key metrics from outcome data
-                generated_files = []
-                conversion_metrics = {}
-                try:
-                    # Handle Documentation step results
-                    if "GeneratedFilesCollection" in outcome_data:
-                        collection = outcome_data["GeneratedFilesCollection"]
-
-                        # Process each phase's files
-                        for phase in ["analysis", "design", "yaml", "documentation"]:
-                            if phase in collection and isinstance(
-                                collection[phase], list
+        async with self._process_guard(process_id):
+            current_process: ProcessStatus | None = None
+            if self.repository:
+                current_process = await self._load_process(process_id)
+                if not current_process:
+                    logger.warning("No current process - cannot record final outcome")
+                    return
+                else:
+                    ts = _get_utc_timestamp()
+
+                    # Extract key metrics from outcome data
+                    generated_files = []
+                    conversion_metrics = {}
+                    try:
+                        # Handle Documentation step results
+                        if "GeneratedFilesCollection" in outcome_data:
+                            collection = outcome_data["GeneratedFilesCollection"]
+
+                            # Process each phase's files; only YAML entries carry
+                            # their own conversion status and accuracy rating
+                            append_file = generated_files.append
+                            for phase in (
+                                "analysis",
+                                "design",
+                                "yaml",
+                                "documentation",
                             ):
-                                for file_info in collection[phase]:
-                                    generated_files.append(
-                                        {
-                                            "phase": phase,
-                                            "file_name": file_info.get("file_name", ""),
-                                            "file_type": file_info.get("file_type", ""),
-                                            "status": file_info.get(
-                                                "conversion_status", "Success"
-                                            )
-                                            if phase == "yaml"
-                                            else "Success",
-                                            "accuracy": file_info.get(
-                                                "accuracy_rating", ""
-                                            )
-                                            if phase == "yaml"
-                                            else "",
-                                            "summary": file_info.get(
-                                                "content_summary", ""
-                                            ),
-                                            "timestamp": _get_utc_timestamp(),
-                                        }
-                                    )
-
-                        # Extract conversion metrics
-                        if "ProcessMetrics" in outcome_data:
-                            metrics = outcome_data["ProcessMetrics"]
-                            conversion_metrics = {
-                                "platform_detected": metrics.get(
-                                    "platform_detected", ""
-                                ),
-                                "conversion_accuracy": metrics.get(
-                                    "conversion_accuracy", ""
-                                ),
-                                "documentation_completeness": metrics.get(
-                                    "documentation_completeness", ""
-                                ),
-                                "enterprise_readiness": metrics.get(
-                                    "enterprise_readiness", ""
-                                ),
-                                "total_files_generated": collection.get(
-                                    "total_files_generated", 0
-                                ),
-                            }
-                except Exception as e:
-                    logger.error(f"Error extracting file and metrics data: {e}")
-                    # Continue with basic outcome recording
-
-                # Record the final outcome
-                current_process.final_outcome = {
-                    "success": success,
-                    "outcome_data": outcome_data,
-                    "timestamp": _get_utc_timestamp(),
-                    "total_steps_completed": len(current_process.step_results),
-                }
+                                phase_files = collection.get(phase)
+                                if not isinstance(phase_files, list):
+                                    continue
+                                if phase == "yaml":
+                                    for file_info in phase_files:
+                                        append_file(
+                                            {
+                                                "phase": phase,
+                                                "file_name": file_info.get(
+                                                    "file_name", ""
+                                                ),
+                                                "file_type": file_info.get(
+                                                    "file_type", ""
+                                                ),
+                                                "status": file_info.get(
+                                                    "conversion_status", "Success"
+                                                ),
+                                                "accuracy": file_info.get(
+                                                    "accuracy_rating", ""
+                                                ),
+                                                "summary": file_info.get(
+                                                    "content_summary", ""
+                                                ),
+                                                "timestamp": ts,
+                                            }
+                                        )
+                                else:
+                                    for file_info in phase_files:
+                                        append_file(
+                                            {
+                                                "phase": phase,
+                                                "file_name": file_info.get(
+                                                    "file_name", ""
+                                                ),
+                                                "file_type": file_info.get(
+                                                    "file_type", ""
+                                                ),
+                                                "status": "Success",
+                                                "accuracy": "",
+                                                "summary": file_info.get(
+                                                    "content_summary", ""
+                                                ),
+                                                "timestamp": ts,
+                                            }
+                                        )
+
+                            # Extract conversion metrics
+                            if "ProcessMetrics" in outcome_data:
+                                metrics = outcome_data["ProcessMetrics"]
+                                conversion_metrics = {
+                                    "platform_detected": metrics.get(
+                                        "platform_detected", ""
+                                    ),
+                                    "conversion_accuracy": metrics.get(
+                                        "conversion_accuracy", ""
+                                    ),
+                                    "documentation_completeness": metrics.get(
+                                        "documentation_completeness", ""
+                                    ),
+                                    "enterprise_readiness": metrics.get(
+                                        "enterprise_readiness", ""
+                                    ),
+                                    "total_files_generated": collection.get(
+                                        "total_files_generated", 0
+                                    ),
+                                }
+                    except Exception as e:
+                        logger.error(f"Error extracting file and metrics data: {e}")
+                        # Continue with basic outcome recording
 
-                current_process.generated_files = generated_files
-                current_process.conversion_metrics = conversion_metrics
+                    # Record the final outcome
+                    current_process.final_outcome = {
+                        "success": success,
+                        "outcome_data": outcome_data,
+                        "timestamp": ts,
+                        "total_steps_completed": len(current_process.step_results),
+                    }
 
-                logger.info(
-                    f"[TELEMETRY] Recorded final outcome - Success: {success}, Files: {len(generated_files)}"
-                )
+                    current_process.generated_files = generated_files
+                    current_process.conversion_metrics = conversion_metrics
 
-                if self.repository:
-                    try:
-                        await self.repository.update_async(current_process)
-                    except Exception as e:
-                        logger.error(f"Error recording final outcome: {e}")
+                    logger.info(
+                        f"[TELEMETRY] Recorded final outcome - Success: {success}, Files: {len(generated_files)}"
+                    )
+
+                    if self.repository:
+                        try:
+                            await self._save_process(current_process)
+                        except Exception as e:
+                            logger.error(f"Error recording final outcome: {e}")
 
     async def record_failure_outcome(
         self,
@@ -903,36 +1098,37 @@ class TelemetryManager:
     ):
         current_process: ProcessStatus | None = None
         if self.repository:
-            current_process = await self.repository.get_async(process_id)
-            """Record failure outcome with detailed error information."""
-            if not current_process:
-                logger.warning("No current process - cannot record failure outcome")
-                return
-            else:
-                failure_data = failure_details or {}
-                current_process.final_outcome = {
-                    "success": False,
-                    "error_message": error_message,
-                    "failed_step": failed_step,
-                    "failure_details": failure_data,
-                    "timestamp": _get_utc_timestamp(),
-                    "total_steps_completed": len(current_process.step_results),
-                }
+            async with self._process_guard(process_id):
+                current_process = await self._load_process(process_id)
+                """Record failure outcome with detailed error information."""
+                if not current_process:
+                    logger.warning("No current process - cannot record failure outcome")
+                    return
+                else:
+                    failure_data = failure_details or {}
+                    current_process.final_outcome = {
+                        "success": False,
+                        "error_message": error_message,
+                        "failed_step": failed_step,
+                        "failure_details": failure_data,
+                        "timestamp": _get_utc_timestamp(),
+                        "total_steps_completed": len(current_process.step_results),
+                    }
 
-                logger.info(
-                    f"[TELEMETRY] Recorded failure outcome - Step: {failed_step}, Error: {error_message}"
-                )
+                    logger.info(
+                        f"[TELEMETRY] Recorded failure outcome - Step: {failed_step}, Error: {error_message}"
+                    )
 
-                try:
-                    await self.repository.update_async(current_process)
-                except Exception as e:
-                    logger.error(f"Error recording failure outcome: {e}")
+                    try:
+                        await self._save_process(current_process)
+                    except Exception as e:
+                        logger.error(f"Error recording failure outcome: {e}")
 
     async def get_final_results_summary(self, process_id: str) -> dict[str, Any]:
         """Get a summary of the final results for external consumption."""
         current_process: ProcessStatus | None = None
         if self.repository:
-            current_process = await self.repository.get_async(process_id)
+            current_process = await self.get_current_process(process_id)
             if not current_process:
                 return {"error": "No active process"}
             else:
@@ -961,8 +1157,8 @@ class TelemetryManager:
                 logger.info("[TELEMETRY] Development mode - UI data recorded in memory")
                 return
 
-            async with self._read_semaphore:
-                current_process = await self.repository.get_async(process_id)
+            async with self._process_guard(process_id):
+                current_process = await self._load_process(process_id)
                 if not current_process:
                     logger.warning(
                         f"[UI-TELEMETRY] Process {process_id} not found for UI data recording"
@@ -976,7 +1172,7 @@ class TelemetryManager:
                 current_process.ui_telemetry_data.update(ui_data)  # type: ignore
                 current_process.last_update_time = _get_utc_timestamp()
 
-                await self.repository.update_async(current_process)
+                await self._save_process(current_process)
 
                 # Log summary
                 file_count = len(
@@ -1012,7 +1208,7 @@ class TelemetryManager:
                 logger.info("[TELEMETRY] Development mode - returning empty UI data")
                 return {}
 
-            current_process = await self.repository.get_async(process_id)
+            current_process = await self.get_current_process(process_id)
             if not current_process:
                 logger.warning(f"[UI-TELEMETRY] Process {process_id} not found")
                 return {}
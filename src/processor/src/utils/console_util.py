@@ -28,71 +28,72 @@ class ConsoleColors:
     BG_BLUE = "\033[44m"
 
 
+# Display label and content color per agent, built once at import time
+_AGENT_STYLES = {
+    "Technical_Architect": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.MAGENTA}[BUILDING]  Chief Architect{ConsoleColors.RESET}",
+        ConsoleColors.MAGENTA,
+    ),
+    "GKE_Expert": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.GREEN}[CLOUD]  GKE EXPERT{ConsoleColors.RESET}",
+        ConsoleColors.GREEN,
+    ),
+    "EKS_Expert": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.YELLOW}[CLOUD]  EKS EXPERT{ConsoleColors.RESET}",
+        ConsoleColors.YELLOW,
+    ),
+    "Azure_Expert": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.CYAN}[CLOUD]  AZURE EXPERT{ConsoleColors.RESET}",
+        ConsoleColors.CYAN,
+    ),
+    "YAML_Expert": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.WHITE}[NOTES] YAML EXPERT{ConsoleColors.RESET}",
+        ConsoleColors.WHITE,
+    ),
+    # "Azure_Network_Engineer": (
+    #     f"{ConsoleColors.BOLD}{ConsoleColors.BLUE}[GLOBE] NETWORK ENGINEER{ConsoleColors.RESET}",
+    #     ConsoleColors.BLUE,
+    # ),
+    # "Azure_Security_Engineer": (
+    #     f"{ConsoleColors.BOLD}{ConsoleColors.RED}[LOCK] SECURITY ENGINEER{ConsoleColors.RESET}",
+    #     ConsoleColors.RED,
+    # ),
+    # "Azure_DevOps_Engineer": (
+    #     f"{ConsoleColors.BOLD}{ConsoleColors.GREEN}[CONFIG]  DEVOPS ENGINEER{ConsoleColors.RESET}",
+    #     ConsoleColors.GREEN,
+    # ),
+    # "Azure_Storage_Engineer": (
+    #     f"{ConsoleColors.BOLD}{ConsoleColors.YELLOW}[SAVE] STORAGE ENGINEER{ConsoleColors.RESET}",
+    #     ConsoleColors.YELLOW,
+    # ),
+    "Technical_Writer": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.MAGENTA}[BOOKS] TECHNICAL WRITER{ConsoleColors.RESET}",
+        ConsoleColors.MAGENTA,
+    ),
+    "QA_Engineer": (
+        f"{ConsoleColors.BOLD}{ConsoleColors.CYAN}[SUCCESS] QA ENGINEER{ConsoleColors.RESET}",
+        ConsoleColors.CYAN,
+    ),
+}
+_ASSISTANT_STYLE = (
+    f"{ConsoleColors.BOLD}{ConsoleColors.WHITE}[ROBOT] ASSISTANT{ConsoleColors.RESET}",
+    ConsoleColors.WHITE,
+)
+_USER_STYLE = (
+    f"{ConsoleColors.BOLD}{ConsoleColors.BLUE}[USER] USER{ConsoleColors.RESET}",
+    ConsoleColors.BLUE,
+)
+
+
 def get_role_style(role, name=None):
     """Get color, icon, and formatting for different roles and agents"""
 
     # Role-based styling
     if role == AuthorRole.USER:
-        return (
-            f"{ConsoleColors.BOLD}{ConsoleColors.BLUE}[USER] USER{ConsoleColors.RESET}",
-            ConsoleColors.BLUE,
-        )
+        return _USER_STYLE
     elif role == AuthorRole.ASSISTANT:
         # Agent-specific styling
-        agent_styles = {
-            "Technical_Architect": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.MAGENTA}[BUILDING]  Chief Architect{ConsoleColors.RESET}",
-                ConsoleColors.MAGENTA,
-            ),
-            "GKE_Expert": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.GREEN}[CLOUD]  GKE EXPERT{ConsoleColors.RESET}",
-                ConsoleColors.GREEN,
-            ),
-            "EKS_Expert": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.YELLOW}[CLOUD]  EKS EXPERT{ConsoleColors.RESET}",
-                ConsoleColors.YELLOW,
-            ),
-            "Azure_Expert": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.CYAN}[CLOUD]  AZURE EXPERT{ConsoleColors.RESET}",
-                ConsoleColors.CYAN,
-            ),
-            "YAML_Expert": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.WHITE}[NOTES] YAML EXPERT{ConsoleColors.RESET}",
-                ConsoleColors.WHITE,
-            ),
-            # "Azure_Network_Engineer": (
-            #     f"{ConsoleColors.BOLD}{ConsoleColors.BLUE}[GLOBE] NETWORK ENGINEER{ConsoleColors.RESET}",
-            #     ConsoleColors.BLUE,
-            # ),
-            # "Azure_Security_Engineer": (
-            #     f"{ConsoleColors.BOLD}{ConsoleColors.RED}[LOCK] SECURITY ENGINEER{ConsoleColors.RESET}",
-            #     ConsoleColors.RED,
-            # ),
-            # "Azure_DevOps_Engineer": (
-            #     f"{ConsoleColors.BOLD}{ConsoleColors.GREEN}[CONFIG]  DEVOPS ENGINEER{ConsoleColors.RESET}",
-            #     ConsoleColors.GREEN,
-            # ),
-            # "Azure_Storage_Engineer": (
-            #     f"{ConsoleColors.BOLD}{ConsoleColors.YELLOW}[SAVE] STORAGE ENGINEER{ConsoleColors.RESET}",
-            #     ConsoleColors.YELLOW,
-            # ),
-            "Technical_Writer": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.MAGENTA}[BOOKS] TECHNICAL WRITER{ConsoleColors.RESET}",
-                ConsoleColors.MAGENTA,
-            ),
-            "QA_Engineer": (
-                f"{ConsoleColors.BOLD}{ConsoleColors.CYAN}[SUCCESS] QA ENGINEER{ConsoleColors.RESET}",
-                ConsoleColors.CYAN,
-            ),
-        }
-
-        if name and name in agent_styles:
-            return agent_styles[name]
-        else:
-            return (
-                f"{ConsoleColors.BOLD}{ConsoleColors.WHITE}[ROBOT] ASSISTANT{ConsoleColors.RESET}",
-                ConsoleColors.WHITE,
-            )
+        return _AGENT_STYLES.get(name, _ASSISTANT_STYLE)
     else:
         return (
             f"{ConsoleColors.GRAY}[QUESTION] {role.upper()}{ConsoleColors.RESET}",
@@ -0,0 +1,15 @@
+from functools import lru_cache
+
+from jinja2 import Template
+
+
+@lru_cache(maxsize=256)
+def get_template(source: str) -> Template:
+    """
+    Return a compiled Jinja2 template for the given source text.
+
+    Prompts are module-level constants rendered on every orchestration turn;
+    parsing and compiling them is the expensive part, so compiled templates
+    are cached by source. Template objects are safe to render concurrently.
+    """
+    return Template(source)